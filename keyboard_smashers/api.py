@@ -8,7 +8,8 @@ load_dotenv()
 
 from keyboard_smashers.logging_config import setup_logging  # noqa: E402
 from keyboard_smashers.controllers.review_controller import (   # noqa: E402
-     router as review_router, review_controller_instance
+     router as review_router, review_controller_instance,
+     configure_admin_logger
 )
 from keyboard_smashers.controllers.user_controller import (    # noqa: E402
      router as user_router, user_controller_instance
@@ -51,6 +52,7 @@ app.include_router(penalty_router)
 async def load_data():
     try:
         logger.info("Starting up and loading dataset...")
+        configure_admin_logger()
         dataset_dir = Path("data")
 
         # Load users
@@ -119,6 +121,7 @@ async def save_data():
         logger.info("Shutting down and saving user data...")
         dataset_dir = Path("data")
         user_controller_instance.user_dao.save_users()
+        user_controller_instance.user_dao.close()
         logger.info("User data saved successfully.")
 
         penalty_csv = dataset_dir / "penalties.csv"
@@ -3,6 +3,7 @@ from typing import Optional, Annotated
 import secrets
 from datetime import datetime, timedelta
 import logging
+from keyboard_smashers.models.user_model import User
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ class SessionManager:
             'created_at': datetime.now(),
             'expires_at': datetime.now() + SESSION_TIMEOUT
         }
-        logger.info(f"Session created for user: {user_id}")
+        logger.info("Session created for user: %s", user_id)
         return session_token
 
     @staticmethod
@@ -32,7 +33,7 @@ class SessionManager:
         session = sessions[session_token]
 
         if datetime.now() > session['expires_at']:
-            logger.warning(f"Expired session attempt: {session_token[:8]}...")
+            logger.warning("Expired session attempt: %s...", session_token[:8])
             del sessions[session_token]
             return None
 
@@ -43,7 +44,7 @@ class SessionManager:
         if session_token in sessions:
             user_id = sessions[session_token]['user_id']
             del sessions[session_token]
-            logger.info(f"Session deleted for user: {user_id}")
+            logger.info("Session deleted for user: %s", user_id)
             return True
         return False
 
@@ -55,7 +56,7 @@ class SessionManager:
         for token in expired:
             del sessions[token]
         if expired:
-            logger.info(f"Cleaned up {len(expired)} expired sessions")
+            logger.info("Cleaned up %s expired sessions", len(expired))
 
     @staticmethod
     def invalidate_user_sessions(user_id: str):
@@ -71,8 +72,8 @@ class SessionManager:
             del sessions[token]
         if tokens_to_delete:
             logger.info(
-                f"Invalidated {len(tokens_to_delete)} sessions "
-                f"for user: {user_id}"
+                "Invalidated %s sessions for user: %s",
+                len(tokens_to_delete), user_id
             )
 
 
@@ -91,7 +92,7 @@ async def get_current_user(
 
     user_id = SessionManager.validate_session(session_token)
     if not user_id:
-        logger.warning(f"Invalid session token: {session_token[:8]}...")
+        logger.warning("Invalid session token: %s...", session_token[:8])
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired session. Please login again."
@@ -122,10 +123,68 @@ async def get_current_admin_user(
     user = user_controller_instance.get_user_by_id(current_user_id)
     if not user or not user.is_admin:
         logger.warning(
-            f"Non-admin user attempted admin action: {current_user_id}")
+            "Non-admin user attempted admin action: %s",
+            current_user_id
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required"
+        )
+
+    return current_user_id
+
+
+async def get_current_user_model(
+    current_user_id: Annotated[str, Depends(get_current_user)]
+) -> User:
+    from keyboard_smashers.controllers.user_controller import (
+        user_controller_instance
+    )
+
+    return user_controller_instance.get_user_model_by_id(current_user_id)
+
+
+async def get_current_admin_model(
+    current_user: Annotated[User, Depends(get_current_user_model)]
+) -> User:
+    if not current_user.is_admin:
+        logger.warning(
+            "Non-admin user attempted admin action: %s",
+            current_user.userid
+        )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required"
         )
 
+    return current_user
+
+
+async def get_current_active_user(
+    current_user_id: Annotated[str, Depends(get_current_user)]
+) -> str:
+    from keyboard_smashers.controllers.user_controller import (
+        user_controller_instance
+    )
+
+    try:
+        suspended = user_controller_instance.user_dao.is_suspended(
+            current_user_id
+        )
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with ID '{current_user_id}' not found"
+        )
+
+    if suspended:
+        logger.warning(
+            "Suspended user attempted write action: %s",
+            current_user_id
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account is suspended. Please contact an administrator."
+        )
+
     return current_user_id
@@ -149,7 +149,7 @@ class MovieController:
             )
 
         logger.info(f"Fetching movies with skip={skip}, limit={limit}")
-        all_movies = self.movie_dao.get_all_movies()
+        all_movies = self.movie_dao.get_all_movies(copy=False)
         total = len(all_movies)
 
         # Apply pagination
@@ -188,11 +188,7 @@ class MovieController:
 
     def create_movie(self, movie_data: MovieCreateSchema) -> MovieSchema:
         logger.info(f"Creating movie: {movie_data.title}")
-        all_movies = self.movie_dao.get_all_movies()
-        if any(
-            m['title'].lower() == movie_data.title.lower()
-            for m in all_movies
-        ):
+        if self.movie_dao.find_movie_id_by_title(movie_data.title):
             logger.warning(f"Duplicate title attempted: {movie_data.title}")
             raise HTTPException(
                 status_code=400,
@@ -222,11 +218,8 @@ class MovieController:
             )
 
         if movie_data.title:
-            all_movies = self.movie_dao.get_all_movies()
-            if any(
-                m['title'].lower() == movie_data.title.lower() and
-                m['movie_id'] != movie_id
-                for m in all_movies
+            if self.movie_dao.find_movie_id_by_title(
+                movie_data.title, exclude_id=movie_id
             ):
                 logger.warning(
                     f"Duplicate title attempted: {movie_data.title}"
@@ -303,7 +296,7 @@ class MovieController:
             )
 
         logger.info(f"Searching movies by title: {title}")
-        all_movies = self.movie_dao.get_all_movies()
+        all_movies = self.movie_dao.get_all_movies(copy=False)
 
         title_lower = title.lower()
         matching_movies = [
@@ -330,7 +323,7 @@ class MovieController:
             )
 
         logger.info(f"Fetching movies by genre: {genre}")
-        all_movies = self.movie_dao.get_all_movies()
+        all_movies = self.movie_dao.get_all_movies(copy=False)
 
         genre_lower = genre.lower().strip()
         matching_movies = []
@@ -380,7 +373,7 @@ class MovieController:
             f"Searching movies: query={query}, sort={sort_by}, "
             f"genre={genre}, year={year}"
         )
-        all_movies = self.movie_dao.get_all_movies()
+        all_movies = self.movie_dao.get_all_movies(copy=False)
 
         # Start with all movies if no query provided
         if query:
@@ -486,14 +479,7 @@ class MovieController:
                 detail=f"Movie with external ID '{external_id}' not found"
             )
 
-        all_movies = self.movie_dao.get_all_movies()
-        existing_movie = next(
-            (m for m in all_movies
-             if m['title'].lower() == external_movie.title.lower()),
-            None
-        )
-
-        if existing_movie:
+        if self.movie_dao.find_movie_id_by_title(external_movie.title):
             logger.warning(
                 f"Movie '{external_movie.title}' already exists locally"
             )
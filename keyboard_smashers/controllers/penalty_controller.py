@@ -1,11 +1,15 @@
-from fastapi import APIRouter, HTTPException, Cookie, Path, Query
+from fastapi import APIRouter, HTTPException, Depends, Path, Query
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime, timedelta
 import logging
 from keyboard_smashers.dao.user_dao import UserDAO
 from keyboard_smashers.dao.penalty_dao import PenaltyDAO
 from keyboard_smashers.models.penalty_model import Penalty
+from keyboard_smashers.models.user_model import User
+from keyboard_smashers.auth import (
+    get_current_admin_model, get_current_user, get_current_user_model
+)
 
 logger = logging.getLogger(__name__)
 
@@ -47,8 +51,7 @@ class PenaltyAPISchema(BaseModel):
         "Whether penalty is currently active")
     )
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CreatePenaltySchema(BaseModel):
@@ -69,18 +72,17 @@ class CreatePenaltySchema(BaseModel):
         "When penalty ends (None = permanent)")
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "user_id": "user_000",
-                "reason": "Post does not follow community guidelines",
-                "severity": 3,
-                "start_date": datetime.now().replace(
-                    hour=12, minute=0, second=0, microsecond=0).isoformat(),
-                "end_date": (datetime.now() + timedelta(days=7)).replace(
-                    hour=12, minute=0, second=0, microsecond=0).isoformat()
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "user_id": "user_000",
+            "reason": "Post does not follow community guidelines",
+            "severity": 3,
+            "start_date": datetime.now().replace(
+                hour=12, minute=0, second=0, microsecond=0).isoformat(),
+            "end_date": (datetime.now() + timedelta(days=7)).replace(
+                hour=12, minute=0, second=0, microsecond=0).isoformat()
         }
+    })
 
 
 class UpdatePenaltySchema(BaseModel):
@@ -125,30 +127,38 @@ class PaginatedPenaltyResponse(BaseModel):
 class PenaltyController:
 
     penalty_dao = None
-    user_dao = None
 
     def __init__(
         self,
         penalty_csv_path: str = "data/penalties.csv",
-        user_csv_path: str = "data/users.csv"
+        user_dao: Optional[UserDAO] = None
     ):
         if PenaltyController.penalty_dao is None:
             PenaltyController.penalty_dao = (
                 PenaltyDAO(csv_path=penalty_csv_path)
             )
-        if PenaltyController.user_dao is None:
-            PenaltyController.user_dao = UserDAO(csv_path=user_csv_path)
-        else:
-            PenaltyController.user_dao = UserDAO(csv_path=user_csv_path)
         self.penalty_dao = PenaltyController.penalty_dao
-        self.user_dao = PenaltyController.user_dao
+        # Without an explicit DAO, share the user controller's one rather
+        # than opening a second DAO that appends to the same users CSV
+        self._user_dao = user_dao
         logger.info(
             f"PenaltyController initialized with "
             f"{len(self.penalty_dao.penalties)} penalties"
         )
 
+    @property
+    def user_dao(self) -> UserDAO:
+        if self._user_dao is not None:
+            return self._user_dao
+        # Looked up per use: user_controller imports this module, and the
+        # instance there can be swapped after this controller is built
+        from keyboard_smashers.controllers import user_controller
+        return user_controller.user_controller_instance.user_dao
+
     def penalty_to_schema(self, penalty: Penalty) -> PenaltyAPISchema:
-        return PenaltyAPISchema(
+        # Every field comes from a Penalty the DAO already validated
+        # (severity is clamped in the model), so skip re-validation
+        return PenaltyAPISchema.model_construct(
             penalty_id=penalty.penalty_id,
             user_id=penalty.user_id,
             reason=penalty.reason,
@@ -170,8 +180,6 @@ class PenaltyController:
             f" {penalty_data.user_id}"
         )
 
-        self.user_dao.load_users()
-
         try:
             self.user_dao.get_user(penalty_data.user_id)
         except KeyError:
@@ -218,7 +226,6 @@ class PenaltyController:
         logger.debug(f"Retrieving penalty: {penalty_id}")
 
         try:
-            self.user_dao.load_users()
             penalty = self.penalty_dao.get_penalty(penalty_id)
             return self.penalty_to_schema(penalty)
         except KeyError:
@@ -261,7 +268,6 @@ class PenaltyController:
 
         if user_id:
             try:
-                self.user_dao.load_users()
                 self.user_dao.get_user(user_id)
                 penalties = self.penalty_dao.get_penalties_by_user(user_id)
             except KeyError:
@@ -304,7 +310,6 @@ class PenaltyController:
         logger.info(f"Updating penalty: {penalty_id}")
 
         try:
-            self.user_dao.load_users()
             update_dict = {}
 
             if penalty_data.reason is not None:
@@ -360,7 +365,6 @@ class PenaltyController:
         logger.info(f"Fetching penalty summary for user: {user_id}")
 
         try:
-            self.user_dao.load_users()
             self.user_dao.get_user(user_id)
         except KeyError:
             raise HTTPException(
@@ -412,9 +416,7 @@ def get_my_penalties(
         le=MAX_PAGE_LIMIT,
         description="Maximum penalties to return"
     ),
-    session_token: Optional[str] = Cookie(
-        default=None, alias="session_token"
-    )
+    user_id: str = Depends(get_current_user)
 ):
     """Get paginated list of current user's penalties
 
@@ -422,14 +424,6 @@ def get_my_penalties(
     - **skip**: Number of penalties to skip (default: 0)
     - **limit**: Maximum penalties to return (default: 50, max: 100)
     """
-    from keyboard_smashers.auth import SessionManager
-
-    if not session_token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    user_id = SessionManager.validate_session(session_token)
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Invalid session")
 
     return penalty_controller_instance.get_all_penalties(
         status=status,
@@ -444,29 +438,15 @@ def get_user_penalty_summary(
     user_id: str = Path(
         ..., min_length=PATH_MIN_LENGTH, max_length=PATH_MAX_LENGTH
     ),
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    requester: User = Depends(get_current_user_model)
 ):
     """Get summary of active and historical penalties for a user
 
     Returns both active and historical penalties separately with counts.
     Accessible by admins or the user themselves.
     """
-    from keyboard_smashers.auth import SessionManager
-    from keyboard_smashers.controllers.user_controller import (
-        user_controller_instance
-    )
-
-    if not session_token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    requester_id = SessionManager.validate_session(session_token)
-    if not requester_id:
-        raise HTTPException(status_code=401, detail="Invalid session")
-
-    requester = user_controller_instance.get_user_model_by_id(requester_id)
-
     # Allow access if requester is admin OR requesting their own penalties
-    if not requester.is_admin and requester_id != user_id:
+    if not requester.is_admin and requester.userid != user_id:
         raise HTTPException(
             status_code=403,
             detail="You can only view your own penalty summary"
@@ -480,29 +460,12 @@ def get_user_penalty_summary(
 @router.post("/", response_model=PenaltyAPISchema, status_code=201)
 def create_penalty(
     penalty_data: CreatePenaltySchema,
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    admin: User = Depends(get_current_admin_model)
 ):
-
-    from keyboard_smashers.auth import SessionManager
-    from keyboard_smashers.controllers.user_controller import (
-        user_controller_instance
+    return penalty_controller_instance.create_penalty(
+        penalty_data, admin.userid
     )
 
-    if not session_token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    admin_id = SessionManager.validate_session(session_token)
-    if not admin_id:
-        raise HTTPException(status_code=401, detail="Invalid session")
-
-    admin = user_controller_instance.get_user_model_by_id(admin_id)
-    if not admin.is_admin:
-        raise HTTPException(status_code=403, detail=(
-            "Admin privileges required")
-        )
-
-    return penalty_controller_instance.create_penalty(penalty_data, admin_id)
-
 
 @router.get("/", response_model=PaginatedPenaltyResponse)
 def get_all_penalties(
@@ -523,9 +486,7 @@ def get_all_penalties(
         le=MAX_PAGE_LIMIT,
         description="Maximum penalties to return"
     ),
-    session_token: Optional[str] = Cookie(
-        default=None, alias="session_token"
-    )
+    _: User = Depends(get_current_admin_model)
 ):
     """Get paginated list of all penalties (admin only)
 
@@ -534,24 +495,6 @@ def get_all_penalties(
     - **skip**: Number of penalties to skip (default: 0)
     - **limit**: Maximum penalties to return (default: 50, max: 100)
     """
-    from keyboard_smashers.auth import SessionManager
-    from keyboard_smashers.controllers.user_controller import (
-        user_controller_instance
-    )
-
-    if not session_token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    admin_id = SessionManager.validate_session(session_token)
-    if not admin_id:
-        raise HTTPException(status_code=401, detail="Invalid session")
-
-    admin = user_controller_instance.get_user_model_by_id(admin_id)
-    if not admin.is_admin:
-        raise HTTPException(status_code=403, detail=(
-            "Admin privileges required")
-        )
-
     return penalty_controller_instance.get_all_penalties(
         status=status, user_id=user_id, skip=skip, limit=limit)
 
@@ -561,26 +504,8 @@ def get_penalty(
     penalty_id: str = Path(
         ..., min_length=PATH_MIN_LENGTH, max_length=PATH_MAX_LENGTH
     ),
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    _: User = Depends(get_current_admin_model)
 ):
-    from keyboard_smashers.auth import SessionManager
-    from keyboard_smashers.controllers.user_controller import (
-        user_controller_instance
-    )
-
-    if not session_token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    admin_id = SessionManager.validate_session(session_token)
-    if not admin_id:
-        raise HTTPException(status_code=401, detail="Invalid session")
-
-    admin = user_controller_instance.get_user_model_by_id(admin_id)
-    if not admin.is_admin:
-        raise HTTPException(status_code=403, detail=(
-            "Admin privileges required")
-        )
-
     return penalty_controller_instance.get_penalty_by_id(penalty_id)
 
 
@@ -590,26 +515,8 @@ def update_penalty(
         ..., min_length=PATH_MIN_LENGTH, max_length=PATH_MAX_LENGTH
     ),
     penalty_data: UpdatePenaltySchema = None,
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    _: User = Depends(get_current_admin_model)
 ):
-    from keyboard_smashers.auth import SessionManager
-    from keyboard_smashers.controllers.user_controller import (
-        user_controller_instance
-    )
-
-    if not session_token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    admin_id = SessionManager.validate_session(session_token)
-    if not admin_id:
-        raise HTTPException(status_code=401, detail="Invalid session")
-
-    admin = user_controller_instance.get_user_model_by_id(admin_id)
-    if not admin.is_admin:
-        raise HTTPException(status_code=403, detail=(
-            "Admin privileges required")
-        )
-
     return penalty_controller_instance.update_penalty(penalty_id, penalty_data)
 
 
@@ -618,24 +525,6 @@ def delete_penalty(
     penalty_id: str = Path(
         ..., min_length=PATH_MIN_LENGTH, max_length=PATH_MAX_LENGTH
     ),
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    _: User = Depends(get_current_admin_model)
 ):
-    from keyboard_smashers.auth import SessionManager
-    from keyboard_smashers.controllers.user_controller import (
-        user_controller_instance
-    )
-
-    if not session_token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    admin_id = SessionManager.validate_session(session_token)
-    if not admin_id:
-        raise HTTPException(status_code=401, detail="Invalid session")
-
-    admin = user_controller_instance.get_user_model_by_id(admin_id)
-    if not admin.is_admin:
-        raise HTTPException(status_code=403, detail=(
-            "Admin privileges required")
-        )
-
     return penalty_controller_instance.delete_penalty(penalty_id)
@@ -1,11 +1,24 @@
-from fastapi import APIRouter, HTTPException, Depends, Query, Path, Cookie
-from typing import List, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from fastapi import APIRouter, HTTPException, Depends, Query, Path
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+from collections import OrderedDict
+from dataclasses import dataclass
+import heapq
 import logging
+import time
+from threading import Lock
+from operator import itemgetter
 from pathlib import Path as FilePath
 from keyboard_smashers.dao.review_dao import review_dao_instance
 from keyboard_smashers.dao.report_dao import ReportDAO
-from keyboard_smashers.auth import get_current_user, get_current_admin_user
+from keyboard_smashers.auth import (
+    get_current_user, get_current_active_user,
+    get_current_admin_user, get_current_user_optional
+)
+from keyboard_smashers.controllers.user_controller import (
+    user_controller_instance
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +34,14 @@ DEFAULT_REPORTS_LIMIT = 50
 MAX_PAGE_LIMIT = 100
 MIN_PAGE_LIMIT = 1
 
+# Anonymous movie review page cache
+MOVIE_REVIEWS_CACHE_MAXSIZE = 2048
+MOVIE_REVIEWS_CACHE_TTL_SECONDS = 15
+
+# Per-user followed-ids cache for the following feed
+FOLLOWING_CACHE_MAXSIZE = 10000
+FOLLOWING_CACHE_TTL_SECONDS = 60
+
 # Path validation constants
 PATH_MIN_LENGTH = 1
 PATH_MAX_LENGTH = 100
@@ -30,13 +51,20 @@ REVIEW_TEXT_MIN_LENGTH = 1
 REVIEW_TEXT_MAX_LENGTH = 250
 REPORT_REASON_MAX_LENGTH = 500
 
-# Setup admin actions logger
+# Admin actions logger (file handler is attached at application startup)
 admin_logger = logging.getLogger('admin_actions')
 admin_logger.setLevel(logging.INFO)
-if not admin_logger.handlers:
-    log_dir = FilePath('logs')
-    log_dir.mkdir(exist_ok=True)
-    admin_handler = logging.FileHandler('logs/admin_actions.log')
+
+
+def configure_admin_logger(log_dir: str = "logs") -> None:
+    """Attach the admin actions file handler once per process"""
+    if admin_logger.handlers:
+        return
+
+    FilePath(log_dir).mkdir(exist_ok=True)
+    admin_handler = logging.FileHandler(
+        str(FilePath(log_dir) / 'admin_actions.log')
+    )
     admin_handler.setFormatter(
         logging.Formatter(
             '%(asctime)s - %(levelname)s - %(message)s',
@@ -62,6 +90,10 @@ class ReviewSchema(BaseModel):
     review_date: str = Field(..., description="Review date")
 
 
+# Validates a whole page of review dicts in one call
+_review_list_adapter = TypeAdapter(List[ReviewSchema])
+
+
 class ReviewCreateSchema(BaseModel):
     movie_id: str = Field(
         ..., description="Movie ID to review", min_length=PATH_MIN_LENGTH
@@ -121,6 +153,26 @@ class ReportedReviewSchema(BaseModel):
     )
 
 
+@dataclass(slots=True)
+class EnrichedReport:
+    """Report joined with its review details for the admin dashboard.
+
+    Lightweight counterpart of ReportedReviewSchema built per row on the
+    admin hot path; serialized directly by ORJSONResponse.
+    """
+    report_id: str
+    review_id: str
+    reporting_user_id: str
+    reason: str
+    admin_viewed: bool
+    timestamp: str
+    review_text: str
+    rating: float
+    movie_id: str
+    reviewer_user_id: Optional[str]
+    imdb_username: Optional[str]
+
+
 class PaginatedReportedReviewsResponse(BaseModel):
     """Response model for paginated reported reviews"""
     reports: List[ReportedReviewSchema] = Field(
@@ -142,14 +194,110 @@ class ReviewController:
     ):
         self.review_dao = review_dao_instance
         self.report_dao = ReportDAO()
+        # (movie_id, skip, limit) -> (expires_at, version, response)
+        self._movie_reviews_cache: OrderedDict = OrderedDict()
+        # Sync endpoints share the cache from the threadpool
+        self._movie_reviews_lock = Lock()
+        # user_id -> (expires_at, user_dict, version, (active_ids, count))
+        self._following_cache: OrderedDict = OrderedDict()
+        self._following_lock = Lock()
         logger.info(
-            f"ReviewController initialized with "
-            f"{len(self.review_dao.reviews)} reviews"
+            "ReviewController initialized with %s reviews",
+            len(self.review_dao.reviews)
         )
 
     def _dict_to_schema(self, review_dict: dict) -> ReviewSchema:
         return ReviewSchema(**review_dict)
 
+    def _dicts_to_schemas(
+        self, review_dicts: List[dict]
+    ) -> List[ReviewSchema]:
+        return _review_list_adapter.validate_python(review_dicts)
+
+    def _review_dicts_for_response(
+            self, review_dicts: List[dict]) -> List[dict]:
+        # DAO dicts are validated on write, so project them onto the
+        # ReviewSchema fields directly instead of building models that
+        # would only be dumped straight back to dicts.
+        return [
+            {
+                'review_id': review['review_id'],
+                'movie_id': review['movie_id'],
+                'user_id': review.get('user_id'),
+                'imdb_username': review.get('imdb_username'),
+                'rating': float(review['rating']),
+                'review_text': review['review_text'],
+                'review_date': review['review_date'],
+            }
+            for review in review_dicts
+        ]
+
+    def _movie_reviews_version(self, movie_id: str) -> tuple:
+        """Version token for the anonymous view of a movie's reviews"""
+        return (
+            self.review_dao.movie_versions.get(movie_id, 0),
+            user_controller_instance.user_dao.visibility_version
+        )
+
+    def get_following_ids(self, user_id: str) -> Tuple[tuple, int]:
+        """
+        Get the ids of the non-suspended users someone follows, plus how
+        many users they follow in total. Cached per user until they
+        follow/unfollow/block someone or user visibility changes.
+        A user who doesn't exist (e.g. deleted mid-session) follows no one.
+        """
+        user_dao = user_controller_instance.user_dao
+        users = user_dao.users
+        try:
+            user = users[user_id]
+        except KeyError:
+            return (), 0
+        version = (
+            user_dao.user_versions.get(user_id, 0),
+            user_dao.visibility_version
+        )
+        with self._following_lock:
+            cached = self._following_cache.get(user_id)
+            if cached is not None:
+                expires_at, cached_user, cached_version, result = cached
+                if (expires_at > time.monotonic() and
+                        cached_user is user and cached_version == version):
+                    self._following_cache.move_to_end(user_id)
+                    return result
+                self._following_cache.pop(user_id, None)
+
+        # Look each followed user up once, so one deleted meanwhile is
+        # simply skipped
+        following = [
+            (following_id, users.get(following_id))
+            for following_id in user.get('following', [])
+        ]
+        following = [
+            (following_id, followed) for following_id, followed in following
+            if followed is not None
+        ]
+        active_ids = tuple(
+            following_id for following_id, followed in following
+            if not followed.get('is_suspended', False)
+        )
+        result = (active_ids, len(following))
+
+        with self._following_lock:
+            self._following_cache[user_id] = (
+                time.monotonic() + FOLLOWING_CACHE_TTL_SECONDS,
+                user,
+                version,
+                result
+            )
+            if len(self._following_cache) > FOLLOWING_CACHE_MAXSIZE:
+                self._following_cache.popitem(last=False)
+        return result
+
+    def clear_movie_reviews_cache(self) -> None:
+        """Drop all cached anonymous movie review pages"""
+        with self._movie_reviews_lock:
+            self._movie_reviews_cache.clear()
+
     def _filter_blocked_user_reviews(
         self,
         reviews: List[dict],
@@ -166,12 +314,14 @@ class ReviewController:
             current_user_id: ID of the current viewing user
             user_dao: Optional UserDAO instance for testing
         """
+        # Nothing to filter: no reviews, or only IMDB reviews
+        if all(review.get('user_id') is None for review in reviews):
+            return reviews
+
         if user_dao is None:
-            from keyboard_smashers.controllers.user_controller import (
-                user_controller_instance
-            )
             user_dao = user_controller_instance.user_dao
 
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         filtered_reviews = []
         for review in reviews:
             review_user_id = review.get('user_id')
@@ -185,10 +335,10 @@ class ReviewController:
             try:
                 if not user_dao.is_blocked(current_user_id, review_user_id):
                     filtered_reviews.append(review)
-                else:
+                elif debug_enabled:
                     logger.debug(
-                        f"Filtered review {review.get('review_id')} "
-                        f"from blocked user {review_user_id}"
+                        "Filtered review %s from blocked user %s",
+                        review.get('review_id'), review_user_id
                     )
             except (KeyError, ValueError, AttributeError):
                 # If any error checking block status, include review
@@ -209,12 +359,13 @@ class ReviewController:
             reviews: List of review dictionaries
             user_dao: Optional UserDAO instance for testing
         """
+        if not reviews:
+            return reviews
+
         if user_dao is None:
-            from keyboard_smashers.controllers.user_controller import (
-                user_controller_instance
-            )
             user_dao = user_controller_instance.user_dao
 
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         filtered_reviews = []
         for review in reviews:
             user_id = review.get('user_id')
@@ -229,10 +380,10 @@ class ReviewController:
                 user_dict = user_dao.get_user(user_id)
                 if not user_dict.get('is_suspended', False):
                     filtered_reviews.append(review)
-                else:
+                elif debug_enabled:
                     logger.debug(
-                        f"Filtered review {review.get('review_id')} "
-                        f"from suspended user {user_id}"
+                        "Filtered review %s from suspended user %s",
+                        review.get('review_id'), user_id
                     )
             except (KeyError, ValueError, AttributeError):
                 # User doesn't exist - include review anyway
@@ -249,16 +400,15 @@ class ReviewController:
                 detail="Review ID cannot be empty"
             )
 
-        logger.info(f"Fetching review: {review_id}")
-        try:
-            review_dict = self.review_dao.get_review(review_id)
-            return self._dict_to_schema(review_dict)
-        except KeyError:
-            logger.error(f"Review not found: {review_id}")
+        logger.info("Fetching review: %s", review_id)
+        review_dict = self.review_dao.get_review_or_none(review_id)
+        if review_dict is None:
+            logger.error("Review not found: %s", review_id)
             raise HTTPException(
                 status_code=404,
                 detail=f"Review with ID '{review_id}' not found"
             )
+        return self._dict_to_schema(review_dict)
 
     def get_reviews_for_movie(
         self,
@@ -286,10 +436,28 @@ class ReviewController:
             )
 
         logger.info(
-            f"Fetching reviews for movie: {movie_id} "
-            f"(skip={skip}, limit={limit}, "
-            f"include_suspended={include_suspended})"
+            "Fetching reviews for movie: %s (skip=%s, limit=%s, "
+            "include_suspended=%s)",
+            movie_id, skip, limit, include_suspended
         )
+
+        # Anonymous pages are identical for every visitor, so serve them
+        # from cache while the movie's reviews and user visibility are
+        # unchanged
+        cacheable = current_user_id is None and not include_suspended
+        if cacheable:
+            cache_key = (movie_id, skip, limit)
+            version = self._movie_reviews_version(movie_id)
+            with self._movie_reviews_lock:
+                cached = self._movie_reviews_cache.get(cache_key)
+                if cached is not None:
+                    expires_at, cached_version, response = cached
+                    if (expires_at > time.monotonic() and
+                            cached_version == version):
+                        self._movie_reviews_cache.move_to_end(cache_key)
+                        return response
+                    self._movie_reviews_cache.pop(cache_key, None)
+
         all_reviews = self.review_dao.get_reviews_for_movie(movie_id)
 
         # Filter suspended users' reviews unless explicitly included
@@ -308,13 +476,13 @@ class ReviewController:
         paginated_reviews = all_reviews[skip:skip + limit]
 
         logger.info(
-            f"Found {total} total reviews (after filtering), returning "
-            f"{len(paginated_reviews)} for movie: {movie_id}"
+            "Found %s total reviews (after filtering), returning "
+            "%s for movie: %s",
+            total, len(paginated_reviews), movie_id
         )
 
-        return PaginatedReviewResponse(
-            reviews=[
-                self._dict_to_schema(review) for review in paginated_reviews],
+        response = PaginatedReviewResponse(
+            reviews=self._dicts_to_schemas(paginated_reviews),
             total=total,
             skip=skip,
             limit=limit,
@@ -322,6 +490,19 @@ class ReviewController:
                 skip +
                 limit) < total)
 
+        if cacheable:
+            with self._movie_reviews_lock:
+                cache = self._movie_reviews_cache
+                cache[cache_key] = (
+                    time.monotonic() + MOVIE_REVIEWS_CACHE_TTL_SECONDS,
+                    version,
+                    response
+                )
+                if len(cache) > MOVIE_REVIEWS_CACHE_MAXSIZE:
+                    cache.popitem(last=False)
+
+        return response
+
     def get_reviews_by_user(
         self,
         user_id: str,
@@ -348,9 +529,9 @@ class ReviewController:
             )
 
         logger.info(
-            f"Fetching reviews by user: {user_id} "
-            f"(skip={skip}, limit={limit}, "
-            f"include_suspended={include_suspended})"
+            "Fetching reviews by user: %s (skip=%s, limit=%s, "
+            "include_suspended=%s)",
+            user_id, skip, limit, include_suspended
         )
         all_reviews = self.review_dao.get_reviews_by_user(user_id)
 
@@ -370,13 +551,13 @@ class ReviewController:
         paginated_reviews = all_reviews[skip:skip + limit]
 
         logger.info(
-            f"Found {total} total reviews (after filtering), returning "
-            f"{len(paginated_reviews)} by user: {user_id}"
+            "Found %s total reviews (after filtering), returning "
+            "%s by user: %s",
+            total, len(paginated_reviews), user_id
         )
 
         return PaginatedReviewResponse(
-            reviews=[
-                self._dict_to_schema(review) for review in paginated_reviews],
+            reviews=self._dicts_to_schemas(paginated_reviews),
             total=total,
             skip=skip,
             limit=limit,
@@ -390,8 +571,8 @@ class ReviewController:
         user_id: str
     ) -> ReviewSchema:
         logger.info(
-            f"Creating review for movie {review_data.movie_id} "
-            f"by user {user_id}"
+            "Creating review for movie %s by user %s",
+            review_data.movie_id, user_id
         )
 
         # Verify movie exists
@@ -401,7 +582,7 @@ class ReviewController:
         try:
             movie_controller_instance.get_movie_by_id(review_data.movie_id)
         except HTTPException:
-            logger.error(f"Movie not found: {review_data.movie_id}")
+            logger.error("Movie not found: %s", review_data.movie_id)
             raise HTTPException(
                 status_code=404,
                 detail=f"Movie with ID '{review_data.movie_id}' not found"
@@ -413,12 +594,13 @@ class ReviewController:
             review_dict['user_id'] = user_id
             created_review = self.review_dao.create_review(review_dict)
             logger.info(
-                f"Review created successfully: {created_review['review_id']}"
+                "Review created successfully: %s",
+                created_review['review_id']
             )
             return self._dict_to_schema(created_review)
         except ValueError as e:
             # Duplicate review for this user/movie
-            logger.warning(f"Duplicate review attempt: {str(e)}")
+            logger.warning("Duplicate review attempt: %s", e)
             raise HTTPException(
                 status_code=400,
                 detail=str(e)
@@ -430,13 +612,12 @@ class ReviewController:
         review_data: ReviewUpdateSchema,
         current_user_id: str
     ) -> ReviewSchema:
-        logger.info(f"Updating review: {review_id}")
+        logger.info("Updating review: %s", review_id)
 
         # Get existing review
-        try:
-            existing_review = self.review_dao.get_review(review_id)
-        except KeyError:
-            logger.error(f"Review not found for update: {review_id}")
+        existing_review = self.review_dao.get_review_or_none(review_id)
+        if existing_review is None:
+            logger.error("Review not found for update: %s", review_id)
             raise HTTPException(
                 status_code=404,
                 detail=f"Review with ID '{review_id}' not found"
@@ -445,8 +626,8 @@ class ReviewController:
         # Authorization check - only owner can update
         if existing_review.get('user_id') != current_user_id:
             logger.warning(
-                f"Unauthorized update attempt on review {review_id} "
-                f"by user {current_user_id}"
+                "Unauthorized update attempt on review %s by user %s",
+                review_id, current_user_id
             )
             raise HTTPException(
                 status_code=403,
@@ -455,15 +636,18 @@ class ReviewController:
 
         # Check if IMDB review (cannot be updated)
         if not existing_review.get('user_id'):
-            logger.warning(
-                f"Attempted to update IMDB review: {review_id}"
-            )
+            logger.warning("Attempted to update IMDB review: %s", review_id)
             raise HTTPException(
                 status_code=403,
                 detail="Cannot update legacy IMDB reviews"
             )
 
-        update_dict = review_data.model_dump(exclude_none=True)
+        # Only the fields the client actually sent (and not null)
+        update_dict = {}
+        for field in review_data.model_fields_set:
+            value = getattr(review_data, field)
+            if value is not None:
+                update_dict[field] = value
 
         if not update_dict:
             raise HTTPException(
@@ -474,23 +658,22 @@ class ReviewController:
         try:
             updated_review = self.review_dao.update_review(
                 review_id, update_dict)
-            logger.info(f"Review updated successfully: {review_id}")
+            logger.info("Review updated successfully: %s", review_id)
             return self._dict_to_schema(updated_review)
         except KeyError:
-            logger.error(f"Review not found during update: {review_id}")
+            logger.error("Review not found during update: %s", review_id)
             raise HTTPException(
                 status_code=404,
                 detail=f"Review with ID '{review_id}' not found"
             )
 
     def delete_review(self, review_id: str, current_user_id: str) -> dict:
-        logger.info(f"Deleting review: {review_id}")
+        logger.info("Deleting review: %s", review_id)
 
         # Get existing review
-        try:
-            existing_review = self.review_dao.get_review(review_id)
-        except KeyError:
-            logger.error(f"Review not found for deletion: {review_id}")
+        existing_review = self.review_dao.get_review_or_none(review_id)
+        if existing_review is None:
+            logger.error("Review not found for deletion: %s", review_id)
             raise HTTPException(
                 status_code=404,
                 detail=f"Review with ID '{review_id}' not found"
@@ -499,8 +682,8 @@ class ReviewController:
         # Authorization check - only owner can delete
         if existing_review.get('user_id') != current_user_id:
             logger.warning(
-                f"Unauthorized delete attempt on review {review_id} "
-                f"by user {current_user_id}"
+                "Unauthorized delete attempt on review %s by user %s",
+                review_id, current_user_id
             )
             raise HTTPException(
                 status_code=403,
@@ -509,9 +692,7 @@ class ReviewController:
 
         # Check if IMDB review (cannot be deleted)
         if not existing_review.get('user_id'):
-            logger.warning(
-                f"Attempted to delete IMDB review: {review_id}"
-            )
+            logger.warning("Attempted to delete IMDB review: %s", review_id)
             raise HTTPException(
                 status_code=403,
                 detail="Cannot delete legacy IMDB reviews"
@@ -519,10 +700,10 @@ class ReviewController:
 
         try:
             self.review_dao.delete_review(review_id)
-            logger.info(f"Review deleted successfully: {review_id}")
+            logger.info("Review deleted successfully: %s", review_id)
             return {"message": f"Review '{review_id}' deleted successfully"}
         except KeyError:
-            logger.error(f"Review not found during deletion: {review_id}")
+            logger.error("Review not found during deletion: %s", review_id)
             raise HTTPException(
                 status_code=404,
                 detail=f"Review with ID '{review_id}' not found"
@@ -530,12 +711,11 @@ class ReviewController:
 
     def admin_delete_review(self, review_id: str) -> dict:
         """Admin can delete any review (for moderation)"""
-        logger.info(f"Admin deleting review: {review_id}")
+        logger.info("Admin deleting review: %s", review_id)
 
-        try:
-            existing_review = self.review_dao.get_review(review_id)
-        except KeyError:
-            logger.error(f"Review not found for admin deletion: {review_id}")
+        existing_review = self.review_dao.get_review_or_none(review_id)
+        if existing_review is None:
+            logger.error("Review not found for admin deletion: %s", review_id)
             raise HTTPException(
                 status_code=404,
                 detail=f"Review with ID '{review_id}' not found"
@@ -544,7 +724,8 @@ class ReviewController:
         # Check if IMDB review (cannot be deleted)
         if not existing_review.get('user_id'):
             logger.warning(
-                f"Admin attempted to delete IMDB review: {review_id}"
+                "Admin attempted to delete IMDB review: %s",
+                review_id
             )
             raise HTTPException(
                 status_code=403,
@@ -562,13 +743,13 @@ class ReviewController:
 
             # Log to admin actions
             admin_logger.info(
-                f"ADMIN_DELETE_REVIEW - review_id={review_id}, "
-                f"deleted_reports={deleted_reports}"
+                "ADMIN_DELETE_REVIEW - review_id=%s, deleted_reports=%s",
+                review_id, deleted_reports
             )
 
             logger.info(
-                f"Review {review_id} deleted by admin. "
-                f"Removed {deleted_reports} associated reports."
+                "Review %s deleted by admin. Removed %s associated reports.",
+                review_id, deleted_reports
             )
             return {
                 "message": f"Review '{review_id}' deleted by admin",
@@ -576,7 +757,9 @@ class ReviewController:
             }
         except KeyError:
             logger.error(
-                f"Review not found during admin deletion: {review_id}")
+                "Review not found during admin deletion: %s",
+                review_id
+            )
             raise HTTPException(
                 status_code=404,
                 detail=f"Review with ID '{review_id}' not found"
@@ -602,8 +785,9 @@ class ReviewController:
             )
 
         logger.info(
-            f"Admin fetching reported reviews (skip={skip}, limit={limit}, "
-            f"admin_viewed={admin_viewed})"
+            "Admin fetching reported reviews (skip=%s, limit=%s, "
+            "admin_viewed=%s)",
+            skip, limit, admin_viewed
         )
 
         # Get all reports
@@ -616,46 +800,45 @@ class ReviewController:
                 if r.get('admin_viewed', False) == admin_viewed
             ]
 
-        # Sort by timestamp (newest first)
-        all_reports.sort(
-            key=lambda r: r['timestamp'],
-            reverse=True
-        )
-
         total = len(all_reports)
 
-        # Apply pagination
-        paginated_reports = all_reports[skip:skip + limit]
+        # Select only the newest skip + limit reports instead of sorting
+        # the whole list, then apply pagination
+        newest_reports = heapq.nlargest(
+            skip + limit,
+            all_reports,
+            key=itemgetter('timestamp')
+        )
+        paginated_reports = newest_reports[skip:]
 
         # Enrich reports with review details
         enriched_reports = []
         for report in paginated_reports:
-            try:
-                review = self.review_dao.get_review(report['review_id'])
-                enriched_reports.append({
-                    'report_id': report['report_id'],
-                    'review_id': report['review_id'],
-                    'reporting_user_id': report['reporting_user_id'],
-                    'reason': report.get('reason', ''),
-                    'admin_viewed': report.get('admin_viewed', False),
-                    'timestamp': report['timestamp'].isoformat(),
-                    'review_text': review.get('review_text', ''),
-                    'rating': review.get('rating', 0),
-                    'movie_id': review.get('movie_id', ''),
-                    'reviewer_user_id': review.get('user_id'),
-                    'imdb_username': review.get('imdb_username')
-                })
-            except KeyError:
+            review = self.review_dao.get_review_or_none(report['review_id'])
+            if review is None:
                 # Review was deleted, skip this report
                 logger.warning(
-                    f"Review {report['review_id']} not found for "
-                    f"report {report['report_id']}"
+                    "Review %s not found for report %s",
+                    report['review_id'], report['report_id']
                 )
                 continue
+            enriched_reports.append(EnrichedReport(
+                report['report_id'],
+                report['review_id'],
+                report['reporting_user_id'],
+                report.get('reason', ''),
+                report.get('admin_viewed', False),
+                report['timestamp'].isoformat(),
+                review.get('review_text', ''),
+                review.get('rating', 0),
+                review.get('movie_id', ''),
+                review.get('user_id'),
+                review.get('imdb_username')
+            ))
 
         logger.info(
-            f"Returning {len(enriched_reports)} reported reviews "
-            f"out of {total} total"
+            "Returning %s reported reviews out of %s total",
+            len(enriched_reports), total
         )
 
         return {
@@ -668,12 +851,12 @@ class ReviewController:
 
     def mark_report_as_viewed(self, report_id: str) -> dict:
         """Mark a report as viewed by admin"""
-        logger.info(f"Admin marking report as viewed: {report_id}")
+        logger.info("Admin marking report as viewed: %s", report_id)
 
         # Check if report exists
         report = self.report_dao.get_report(report_id)
         if not report:
-            logger.error(f"Report not found: {report_id}")
+            logger.error("Report not found: %s", report_id)
             raise HTTPException(
                 status_code=404,
                 detail=f"Report with ID '{report_id}' not found"
@@ -685,18 +868,18 @@ class ReviewController:
         if success:
             # Log to admin actions
             admin_logger.info(
-                f"ADMIN_VIEW_REPORT - report_id={report_id}, "
-                f"review_id={report['review_id']}"
+                "ADMIN_VIEW_REPORT - report_id=%s, review_id=%s",
+                report_id, report['review_id']
             )
 
-            logger.info(f"Report {report_id} marked as viewed by admin")
+            logger.info("Report %s marked as viewed by admin", report_id)
             return {
                 "message": f"Report '{report_id}' marked as viewed",
                 "report_id": report_id,
                 "admin_viewed": True
             }
         else:
-            logger.error(f"Failed to mark report as viewed: {report_id}")
+            logger.error("Failed to mark report as viewed: %s", report_id)
             raise HTTPException(
                 status_code=500,
                 detail="Failed to update report"
@@ -704,12 +887,12 @@ class ReviewController:
 
     def admin_delete_report(self, report_id: str) -> dict:
         """Admin can delete a specific report"""
-        logger.info(f"Admin deleting report: {report_id}")
+        logger.info("Admin deleting report: %s", report_id)
 
         # Check if report exists
         report = self.report_dao.get_report(report_id)
         if not report:
-            logger.error(f"Report not found for admin deletion: {report_id}")
+            logger.error("Report not found for admin deletion: %s", report_id)
             raise HTTPException(
                 status_code=404,
                 detail=f"Report with ID '{report_id}' not found"
@@ -721,17 +904,17 @@ class ReviewController:
         if success:
             # Log to admin actions
             admin_logger.info(
-                f"ADMIN_DELETE_REPORT - report_id={report_id}, "
-                f"review_id={report['review_id']}"
+                "ADMIN_DELETE_REPORT - report_id=%s, review_id=%s",
+                report_id, report['review_id']
             )
 
-            logger.info(f"Report {report_id} deleted by admin")
+            logger.info("Report %s deleted by admin", report_id)
             return {
                 "message": f"Report '{report_id}' deleted by admin",
                 "review_id": report['review_id']
             }
         else:
-            logger.error(f"Failed to delete report: {report_id}")
+            logger.error("Failed to delete report: %s", report_id)
             raise HTTPException(
                 status_code=500,
                 detail="Failed to delete report"
@@ -763,7 +946,7 @@ def get_reviews_for_movie(
         le=MAX_PAGE_LIMIT,
         description="Maximum reviews to return"
     ),
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    current_user_id: Optional[str] = Depends(get_current_user_optional)
 ):
     """
     Get paginated reviews for a specific movie.
@@ -772,16 +955,12 @@ def get_reviews_for_movie(
     - **skip**: Number of reviews to skip (default: 0)
     - **limit**: Maximum reviews to return (default: 10, max: 100)
     """
-    from keyboard_smashers.auth import SessionManager
 
-    # Validate session if token exists
-    current_user_id = None
-    if session_token:
-        current_user_id = SessionManager.validate_session(session_token)
-
-    return review_controller_instance.get_reviews_for_movie(
+    result = review_controller_instance.get_reviews_for_movie(
         movie_id, skip, limit, current_user_id=current_user_id
     )
+    # Already validated by the controller; skip the response_model pass
+    return ORJSONResponse(result.model_dump())
 
 
 @router.get("/user/{user_id}", response_model=PaginatedReviewResponse)
@@ -798,7 +977,7 @@ def get_reviews_by_user(
         le=MAX_PAGE_LIMIT,
         description="Maximum reviews to return"
     ),
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    current_user_id: Optional[str] = Depends(get_current_user_optional)
 ):
     """
     Get paginated reviews by a specific user.
@@ -807,16 +986,12 @@ def get_reviews_by_user(
     - **skip**: Number of reviews to skip (default: 0)
     - **limit**: Maximum reviews to return (default: 10, max: 100)
     """
-    from keyboard_smashers.auth import SessionManager
-
-    # Validate session if token exists
-    current_user_id = None
-    if session_token:
-        current_user_id = SessionManager.validate_session(session_token)
 
-    return review_controller_instance.get_reviews_by_user(
+    result = review_controller_instance.get_reviews_by_user(
         user_id, skip, limit, current_user_id=current_user_id
     )
+    # Already validated by the controller; skip the response_model pass
+    return ORJSONResponse(result.model_dump())
 
 
 @router.get("/{review_id}", response_model=ReviewSchema)
@@ -834,20 +1009,9 @@ def get_review(
 @router.post("/", response_model=ReviewSchema, status_code=201)
 def create_review(
     review_data: ReviewCreateSchema,
-    current_user_id: str = Depends(get_current_user)
+    current_user_id: str = Depends(get_current_active_user)
 ):
-    """Create a new review (requires authentication)"""
-    # Check if user is suspended
-    from keyboard_smashers.controllers.user_controller import (
-        user_controller_instance
-    )
-    user = user_controller_instance.get_user_model_by_id(current_user_id)
-    if user.is_suspended:
-        raise HTTPException(
-            status_code=403,
-            detail="Cannot create review. Account is suspended."
-        )
-
+    """Create a new review (requires an active, non-suspended account)"""
     return review_controller_instance.create_review(
         review_data, current_user_id)
 
@@ -890,13 +1054,13 @@ def report_review(
     current_user_id: str = Depends(get_current_user)
 ):
     """Report a review for moderation (requires authentication)"""
-    logger.info(f"User {current_user_id} reporting review {review_id}")
+    logger.info("User %s reporting review %s", current_user_id, review_id)
 
     # Check if review exists
-    try:
-        review_controller_instance.review_dao.get_review(review_id)
-    except KeyError:
-        logger.error(f"Review not found: {review_id}")
+    if review_controller_instance.review_dao.get_review_or_none(
+        review_id
+    ) is None:
+        logger.error("Review not found: %s", review_id)
         raise HTTPException(
             status_code=404,
             detail=f"Review with ID '{review_id}' not found"
@@ -907,7 +1071,8 @@ def report_review(
         review_id, current_user_id
     ):
         logger.warning(
-            f"User {current_user_id} already reported review {review_id}"
+            "User %s already reported review %s",
+            current_user_id, review_id
         )
         raise HTTPException(
             status_code=400,
@@ -921,7 +1086,7 @@ def report_review(
         reason=reason
     )
 
-    logger.info(f"Report created: {report['report_id']}")
+    logger.info("Report created: %s", report['report_id'])
     return {
         "message": "Review reported successfully",
         "report_id": report['report_id']
@@ -957,10 +1122,12 @@ def admin_get_reported_reviews(
         admin_viewed: Filter by viewed status
             (None=all, False=unviewed, True=viewed)
     """
-    return review_controller_instance.get_reported_reviews_for_admin(
-        skip=skip,
-        limit=limit,
-        admin_viewed=admin_viewed
+    return ORJSONResponse(
+        review_controller_instance.get_reported_reviews_for_admin(
+            skip=skip,
+            limit=limit,
+            admin_viewed=admin_viewed
+        )
     )
 
 
@@ -1001,36 +1168,22 @@ def admin_delete_report(
 def get_following_feed(
     skip: int = DEFAULT_PAGE_OFFSET,
     limit: int = DEFAULT_PAGE_LIMIT,
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    cursor: Optional[str] = None,
+    current_user_id: str = Depends(get_current_user)
 ):
     """
     Get a feed of reviews from users you follow.
-    Efficiently retrieves all reviews from followed users in one call.
+    Fetches the requested page for all followed users in one DAO call.
     Returns reviews sorted by most recent first.
 
+    Pass the returned next_cursor back as cursor to get the next page;
+    skip still works but is deprecated, since deep offsets get slower.
+
     Args:
-        skip: Number of reviews to skip (pagination)
+        skip: Number of reviews to skip (deprecated, ignored with cursor)
         limit: Maximum reviews to return (1-100)
-        session_token: Authentication cookie
+        cursor: Opaque "<review_date>,<review_id>" from next_cursor
     """
-    from keyboard_smashers.auth import SessionManager
-    from keyboard_smashers.controllers.user_controller import (
-        user_controller_instance
-    )
-
-    # Require authentication
-    if not session_token:
-        raise HTTPException(
-            status_code=401,
-            detail="Not authenticated. Please login."
-        )
-
-    current_user_id = SessionManager.validate_session(session_token)
-    if not current_user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session. Please login again."
-        )
 
     # Validate pagination params
     if skip < 0:
@@ -1047,57 +1200,56 @@ def get_following_feed(
             )
         )
 
-    # Get list of users current user follows
-    try:
-        following_users = user_controller_instance.user_dao.get_following(
-            current_user_id
-        )
-        following_ids = [user['userid'] for user in following_users]
-    except KeyError:
-        following_ids = []
+    before = None
+    if cursor is not None:
+        review_date, sep, review_id = cursor.rpartition(',')
+        if not sep or not review_id:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid cursor"
+            )
+        before = (review_date, review_id)
+        skip = 0
 
-    if not following_ids:
-        return {
+    # Ids of the users current user follows; suspended users' reviews
+    # are hidden, so they're already left out
+    active_ids, following_count = (
+        review_controller_instance.get_following_ids(current_user_id)
+    )
+
+    if not following_count:
+        return ORJSONResponse({
             "reviews": [],
             "total": 0,
             "skip": skip,
             "limit": limit,
-            "following_count": 0
-        }
-
-    # Get all reviews from followed users
-    all_reviews = []
-    for user_id in following_ids:
-        dao = review_controller_instance.review_dao
-        user_reviews = dao.get_reviews_by_user(user_id)
-        all_reviews.extend(user_reviews)
-
-    # Filter suspended users
-    all_reviews = review_controller_instance._filter_suspended_user_reviews(
-        all_reviews
+            "has_more": False,
+            "following_count": 0,
+            "next_cursor": None
+        })
+
+    # One batch lookup across all followed users (newest first). Ask
+    # for one extra review so has_more is exact in both offset and
+    # cursor mode, and the last page never hands out a dead cursor.
+    dao = review_controller_instance.review_dao
+    paginated, total = dao.get_reviews_by_user_ids(
+        active_ids, skip, limit + 1, before=before
     )
+    has_more = len(paginated) > limit
+    del paginated[limit:]
 
-    # Sort by creation date (newest first)
-    # Assuming reviews have a timestamp field
-    try:
-        all_reviews.sort(
-            key=lambda r: r.get('timestamp', ''),
-            reverse=True
-        )
-    except (KeyError, TypeError):
-        # If no timestamp, keep original order
-        pass
-
-    total = len(all_reviews)
-    paginated = all_reviews[skip:skip + limit]
+    next_cursor = None
+    if has_more:
+        next_cursor = "%s,%s" % dao.feed_key(paginated[-1])
 
-    return {
-        "reviews": [
-            review_controller_instance._dict_to_schema(review)
-            for review in paginated
-        ],
+    return ORJSONResponse({
+        "reviews": review_controller_instance._review_dicts_for_response(
+            paginated
+        ),
         "total": total,
         "skip": skip,
         "limit": limit,
-        "following_count": len(following_ids)
-    }
+        "has_more": has_more,
+        "following_count": following_count,
+        "next_cursor": next_cursor
+    })
@@ -1,11 +1,26 @@
-from fastapi import APIRouter, HTTPException, Response, Cookie, Path
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from fastapi import (
+    APIRouter, HTTPException, Cookie, Depends, Header, Path, Query, Response
+)
+from fastapi.responses import ORJSONResponse
+from typing import Dict, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from collections import OrderedDict
 from datetime import datetime
+from itertools import islice
+import hashlib
 import logging
+import time
 from keyboard_smashers.dao.user_dao import UserDAO
-from keyboard_smashers.models.user_model import User
-from keyboard_smashers.auth import SessionManager
+from keyboard_smashers.controllers.movie_controller import (
+    movie_controller_instance
+)
+from keyboard_smashers.models.user_model import (
+    DUMMY_PASSWORD_HASH, User, verify_password
+)
+from keyboard_smashers.auth import (
+    SessionManager, get_current_admin_model, get_current_user,
+    get_current_user_model
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,18 +34,25 @@ MIN_PAGE_LIMIT = 1
 PATH_MIN_LENGTH = 1
 PATH_MAX_LENGTH = 100
 SESSION_MAX_AGE_SECONDS = 7200  # 2 hours
+# Cached /search/users pages (typeahead repeats the same queries)
+SEARCH_CACHE_MAXSIZE = 512
+SEARCH_CACHE_TTL_SECONDS = 60
 
 
 class UserAPISchema(BaseModel):
 
-    userid: str = Field(None, description="Unique User ID", example="user_000")
-    username: str = Field(..., description="User's display name", example=(
-        "reviewer_bob"))
-    email: str = Field(..., description="User's email address", example=(
-        "bob@stu.ubc.ca"))
+    userid: Optional[str] = Field(
+        None, description="Unique User ID",
+        json_schema_extra={"example": "user_000"})
+    username: str = Field(
+        ..., description="User's display name",
+        json_schema_extra={"example": "reviewer_bob"})
+    email: str = Field(
+        ..., description="User's email address",
+        json_schema_extra={"example": "bob@stu.ubc.ca"})
     reputation: int = Field(
         DEFAULT_REPUTATION, description="User reputation score")
-    creation_date: datetime = Field(None, description=(
+    creation_date: Optional[datetime] = Field(None, description=(
         "Date user account was created"))
     total_reviews: int = Field(0, description=(
         "Total number of reviews written"))
@@ -44,6 +66,10 @@ class UserAPISchema(BaseModel):
         "List of favorite movie IDs"))
 
 
+# Validates/serializes whole user lists in a single pydantic-core call
+_USER_LIST_ADAPTER = TypeAdapter(List[UserAPISchema])
+
+
 class PublicUserSchema(BaseModel):
     """Minimal user information safe for public viewing"""
     userid: str = Field(..., description="Unique User ID")
@@ -55,8 +81,42 @@ class PublicUserSchema(BaseModel):
                                  description="List of favorite movie IDs")
     is_admin: bool = Field(default=False, description="Whether user is admin")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+def _public_user(user_dict: dict) -> dict:
+    """
+    PublicUserSchema fields of a user dict, as a JSON-ready dict. List
+    endpoints return these through ORJSONResponse rather than building
+    one pydantic model per user.
+    """
+    return {
+        'userid': user_dict['userid'],
+        'username': user_dict['username'],
+        'reputation': user_dict.get('reputation', DEFAULT_REPUTATION),
+        'total_reviews': user_dict.get('total_reviews', 0),
+        'favorites': user_dict.get('favorites', []),
+        'is_admin': user_dict.get('is_admin', False)
+    }
+
+
+def _etag_response(content, if_none_match: Optional[str]) -> Response:
+    """
+    Encode content as an ORJSONResponse tagged with a hash of its body,
+    or an empty 304 if the client already holds that body. The tag is
+    taken from the encoded bytes so it changes with anything shown,
+    including other users' fields and favorites of deleted movies.
+    """
+    response = ORJSONResponse(content)
+    etag = f'"{hashlib.blake2b(response.body, digest_size=8).hexdigest()}"'
+    if if_none_match and (
+            if_none_match.strip() == '*' or etag in [
+                tag.strip().removeprefix('W/')
+                for tag in if_none_match.split(',')
+            ]):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
 
 
 class UserCreateSchema(BaseModel):
@@ -90,10 +150,22 @@ class UserController:
 
     def __init__(self, csv_path: str = ("data/users.csv")):
         if UserController.user_dao is None:
+            # Writes stay synchronous so a request only reports success
+            # once its change is in the CSV (or fails with the error)
             UserController.user_dao = UserDAO(csv_path=csv_path)
         self.user_dao = UserController.user_dao
-        logger.info(f"UserController initialized with"
-                    f" {len(self.user_dao.users)} users")
+        # userid -> (user dict, user version, schema) for read endpoints
+        self._api_cache: Dict[str, Tuple[dict, int, UserAPISchema]] = {}
+        # userid -> (schema, its JSON-ready dump) for list responses
+        self._json_cache: Dict[str, Tuple[UserAPISchema, dict]] = {}
+        # userid -> (user dict, user version, model) for auth dependencies
+        self._model_cache: Dict[str, Tuple[dict, int, User]] = {}
+        # (query, skip, limit) -> (expires_at, version, (userids, total))
+        self._search_cache: OrderedDict = OrderedDict()
+        logger.info(
+            "UserController initialized with %s users",
+            len(self.user_dao.users)
+        )
 
     def dict_to_user_model(self, user_dict: dict) -> User:
         return User(
@@ -108,23 +180,30 @@ class UserController:
             is_suspended=user_dict.get('is_suspended', False)
         )
 
-    def dict_to_schema(self, user_dict: dict) -> UserAPISchema:
-        from keyboard_smashers.controllers.movie_controller import (
-            movie_controller_instance
+    def dict_to_schema(
+        self, user_dict: dict, movies: Optional[dict] = None
+    ) -> UserAPISchema:
+        return UserAPISchema(
+            **self._drop_deleted_favorites(user_dict, movies)
         )
 
-        # Filter out deleted movies from favorites
-        if 'favorites' in user_dict and user_dict['favorites']:
-            valid_favorites = []
-            for movie_id in user_dict['favorites']:
-                try:
-                    movie_controller_instance.movie_dao.get_movie(movie_id)
-                    valid_favorites.append(movie_id)
-                except KeyError:
-                    pass
-            user_dict['favorites'] = valid_favorites
-
-        return UserAPISchema(**user_dict)
+    @staticmethod
+    def _drop_deleted_favorites(
+        user_dict: dict, movies: Optional[dict] = None
+    ) -> dict:
+        """
+        Filter out deleted movies from favorites (a plain membership
+        check; get_movie would copy every movie dict just to drop it).
+        Callers handling many users pass the movie dict in once.
+        """
+        favorites = user_dict.get('favorites')
+        if favorites:
+            if movies is None:
+                movies = movie_controller_instance.movie_dao.movies
+            user_dict['favorites'] = [
+                movie_id for movie_id in favorites if movie_id in movies
+            ]
+        return user_dict
 
     def authenticate_user(self, email: str, password: str):
         # Validate inputs
@@ -135,27 +214,35 @@ class UserController:
             logger.warning("Authentication failed: Password cannot be empty")
             return None
 
-        user_dict = self.user_dao.get_user_by_email(email)
+        userid = self.user_dao.get_userid_by_email(email)
 
-        if not user_dict:
+        if not userid:
+            # Same hash work as a wrong password, so response time doesn't
+            # reveal whether the email is registered
+            verify_password(DUMMY_PASSWORD_HASH, password)
             logger.warning(
-                f"Authentication failed: User not found for email {email}")
+                "Authentication failed: User not found for email %s",
+                email
+            )
             return None
 
-        user = self.dict_to_user_model(user_dict)
+        user = self.get_user_model_by_id(userid)
 
         if not user.check_password(password):
             logger.warning(
-                f"Authentication failed: Invalid password for {email}")
+                "Authentication failed: Invalid password for %s",
+                email
+            )
             return None
 
         logger.info(
-            f"User authenticated successfully:"
-            f"{user.username} ({user.userid})")
+            "User authenticated successfully: %s (%s)",
+            user.username, user.userid
+        )
         return user
 
     def create_user(self, user_data: UserCreateSchema) -> UserAPISchema:
-        logger.info(f"Creating new user: {user_data.username}")
+        logger.info("Creating new user: %s", user_data.username)
 
         temp_user = User(
             userid="temp",
@@ -173,43 +260,58 @@ class UserController:
             'password': temp_user.password,
             'reputation': user_data.reputation,
             'is_admin': user_data.is_admin,
-            'creation_date': datetime.now()
         }
 
         try:
             created_user = self.user_dao.create_user(user_dict)
-            logger.info(f"Created new user: {created_user['userid']}"
-                        f" - {user_data.username}")
+            logger.info(
+                "Created new user: %s - %s",
+                created_user['userid'], user_data.username
+            )
             return self.dict_to_schema(created_user)
 
         except ValueError as e:
-            logger.error(f"Error creating user: {e}")
+            logger.error("Error creating user: %s", e)
             raise HTTPException(status_code=400, detail=str(e))
 
     def update_user_by_id(
         self,
         user_id: str,
             user_data: UpdateUserSchema) -> UserAPISchema:
-        logger.info(f"Attempting to update user: {user_id}")
+        logger.info("Attempting to update user: %s", user_id)
+        # An empty (or missing) body changes nothing: answer from the
+        # schema cache without copying the user or diffing fields
+        if user_data is None or all(value is None for value in (
+                user_data.username, user_data.email, user_data.password,
+                user_data.reputation, user_data.is_admin)):
+            logger.info("No changes to apply for user: %s", user_id)
+            return self.get_user_by_id(user_id)
+
         try:
             existing_user_dict = self.user_dao.get_user(user_id)
         except KeyError:
-            logger.error(f"User with ID '{user_id}' not found for update")
+            logger.error("User with ID '%s' not found for update", user_id)
             raise HTTPException(
                 status_code=404,
                 detail=f"User with ID '{user_id}' not found"
             )
 
+        # Only fields that differ from the stored user are updated, so an
+        # idempotent PUT doesn't rehash the password or write to disk
         update_dict = {}
         try:
-            if user_data.username is not None:
-
+            if (user_data.username is not None and
+                    user_data.username != existing_user_dict['username']):
                 update_dict['username'] = user_data.username
-            if user_data.email is not None:
-
+            if (user_data.email is not None and
+                    user_data.email != existing_user_dict['email']):
                 update_dict['email'] = user_data.email
-            if user_data.password is not None:
-
+            # Legacy plain-text passwords are always rehashed. The check
+            # reads the stored hash directly rather than building a User
+            stored_password = existing_user_dict['password'] or ''
+            if user_data.password is not None and not (
+                    '$' in stored_password and
+                    verify_password(stored_password, user_data.password)):
                 temp_user = User(
                     userid="temp",
                     username="temp",
@@ -217,27 +319,28 @@ class UserController:
                 )
                 temp_user.set_password(user_data.password)
                 update_dict['password'] = temp_user.password
-            if user_data.reputation is not None:
+            if (user_data.reputation is not None and
+                    user_data.reputation != existing_user_dict['reputation']):
                 update_dict['reputation'] = user_data.reputation
-            if user_data.is_admin is not None:
-
+            if (user_data.is_admin is not None and
+                    user_data.is_admin != existing_user_dict['is_admin']):
                 update_dict['is_admin'] = user_data.is_admin
 
             if not update_dict:
-                logger.info(f"No updates provided for user: {user_id}")
-                return self.dict_to_schema(existing_user_dict)
+                logger.info("No changes to apply for user: %s", user_id)
+                return self._cached_schema(user_id)
 
             updated_user = self.user_dao.update_user(user_id, update_dict)
-            logger.info(f"Updated user: {user_id}")
+            logger.info("Updated user: %s", user_id)
 
             return self.dict_to_schema(updated_user)
 
         except ValueError as e:
-            logger.error(f"Error updating user {user_id}: {e}")
+            logger.error("Error updating user %s: %s", user_id, e)
             raise HTTPException(status_code=400, detail=str(e))
 
     def delete_user_by_id(self, user_id: str) -> dict:
-        logger.info(f"Attempting to delete user: {user_id}")
+        logger.info("Attempting to delete user: %s", user_id)
         try:
             # Cascade delete: Remove all user data before deleting user
 
@@ -247,16 +350,15 @@ class UserController:
             )
             try:
                 reviews = review_controller_instance.review_dao
-                user_reviews = reviews.get_reviews_by_user(user_id)
-                for review in user_reviews:
-                    reviews.delete_review(review['review_id'])
+                deleted_reviews = reviews.delete_reviews_by_user(user_id)
                 logger.info(
-                    f"Deleted {len(user_reviews)} reviews "
-                    f"for user {user_id}"
+                    "Deleted %s reviews for user %s",
+                    deleted_reviews, user_id
                 )
             except Exception as e:
                 logger.warning(
-                    f"Error deleting reviews for user {user_id}: {e}"
+                    "Error deleting reviews for user %s: %s",
+                    user_id, e
                 )
 
             # 2. Delete user's penalties
@@ -265,46 +367,50 @@ class UserController:
             )
             try:
                 penalties = penalty_controller_instance.penalty_dao
-                user_penalties = penalties.get_penalties_by_user(user_id)
-                for penalty in user_penalties:
-                    penalties.delete_penalty(penalty.penalty_id)
+                deleted_penalties = penalties.delete_penalties_by_user(
+                    user_id
+                )
                 logger.info(
-                    f"Deleted {len(user_penalties)} penalties "
-                    f"for user {user_id}"
+                    "Deleted %s penalties for user %s",
+                    deleted_penalties, user_id
                 )
             except Exception as e:
                 logger.warning(
-                    f"Error deleting penalties for user {user_id}: {e}"
+                    "Error deleting penalties for user %s: %s",
+                    user_id, e
                 )
 
-            # 3. Delete user's reports
-            from keyboard_smashers.dao.report_dao import ReportDAO
+            # 3. Delete user's reports through the shared report DAO so
+            # the in-memory indexes used by the review endpoints stay
+            # in sync
             try:
-                report_dao = ReportDAO()
-                user_reports = report_dao.get_reports_by_user(user_id)
-                for report in user_reports:
-                    report_dao.delete_report(report['report_id'])
+                report_dao = review_controller_instance.report_dao
+                deleted_reports = report_dao.delete_reports_by_user(user_id)
                 logger.info(
-                    f"Deleted {len(user_reports)} reports "
-                    f"by user {user_id}"
+                    "Deleted %s reports by user %s",
+                    deleted_reports, user_id
                 )
             except Exception as e:
                 logger.warning(
-                    f"Error deleting reports for user {user_id}: {e}"
+                    "Error deleting reports for user %s: %s",
+                    user_id, e
                 )
 
             # 4. Invalidate user's sessions
-            from keyboard_smashers.auth import SessionManager
             try:
                 SessionManager.invalidate_user_sessions(user_id)
-                logger.info(f"Invalidated sessions for user {user_id}")
+                logger.info("Invalidated sessions for user %s", user_id)
             except Exception as e:
                 logger.warning(
-                    f"Error invalidating sessions for user {user_id}: {e}")
+                    "Error invalidating sessions for user %s: %s",
+                    user_id, e
+                )
 
             # 5. Finally, delete the user
             self.user_dao.delete_user(user_id)
-            logger.info(f"Deleted user: {user_id}")
+            self._api_cache.pop(user_id, None)
+            self._json_cache.pop(user_id, None)
+            logger.info("Deleted user: %s", user_id)
             return {
                 "message": (
                     f"User '{user_id}' and all associated data "
@@ -312,16 +418,127 @@ class UserController:
                 )
             }
         except KeyError:
-            logger.error(f"User with ID '{user_id}' not found for deletion")
+            logger.error("User with ID '%s' not found for deletion", user_id)
             raise HTTPException(
                 status_code=404,
                 detail=f"User with ID '{user_id}' not found"
             )
 
-    def get_all_users(self) -> List[UserAPISchema]:
-        logger.debug("Retrieving all users")
-        users = self.user_dao.get_all_users()
-        return [self.dict_to_schema(user) for user in users]
+    def search_user_ids(
+        self, query: str, skip: int, limit: int
+    ) -> Tuple[List[str], int]:
+        """
+        Get (page of userids, total) for a username search. Results are
+        cached while the username index is unchanged; the user dicts are
+        still read per request, so other profile changes show up at once.
+        """
+        needle = query.casefold()
+        if not needle:
+            # An empty query is a slice of the sorted username list;
+            # caching every page offset would only evict real searches
+            return self.user_dao.search_userids_by_username('', skip, limit)
+
+        cache_key = (needle, skip, limit)
+        version = (
+            self.user_dao.username_version, len(self.user_dao.username_index)
+        )
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            expires_at, cached_version, result = cached
+            if expires_at > time.monotonic() and cached_version == version:
+                self._search_cache.move_to_end(cache_key)
+                return result
+            del self._search_cache[cache_key]
+
+        result = self.user_dao.search_userids_by_username(query, skip, limit)
+        self._search_cache[cache_key] = (
+            time.monotonic() + SEARCH_CACHE_TTL_SECONDS,
+            version,
+            result
+        )
+        if len(self._search_cache) > SEARCH_CACHE_MAXSIZE:
+            self._search_cache.popitem(last=False)
+        return result
+
+    def get_all_users(
+        self, skip: int = DEFAULT_PAGE_OFFSET, limit: Optional[int] = None
+    ) -> List[UserAPISchema]:
+        logger.debug("Retrieving users (skip=%s, limit=%s)", skip, limit)
+        return self._cached_schemas(self.user_dao.get_user_ids(skip, limit))
+
+    def get_all_users_json(
+        self, skip: int = DEFAULT_PAGE_OFFSET, limit: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Same as get_all_users, but as JSON-ready dicts. The dumps are
+        cached alongside the schemas, so an unchanged user costs a
+        lookup rather than a validation plus a serialization.
+        """
+        logger.debug("Retrieving users (skip=%s, limit=%s)", skip, limit)
+        user_ids = self.user_dao.get_user_ids(skip, limit)
+        schemas = self._cached_schemas(user_ids)
+        dumps = []
+        stale = []
+        for user_id, schema in zip(user_ids, schemas):
+            cached = self._json_cache.get(user_id)
+            if cached is None or cached[0] is not schema:
+                stale.append(len(dumps))
+                dumps.append(None)
+            else:
+                dumps.append(cached[1])
+
+        if stale:
+            # Serialize every stale schema in one pydantic-core call
+            fresh = _USER_LIST_ADAPTER.dump_python(
+                [schemas[i] for i in stale], mode='json'
+            )
+            for i, dump in zip(stale, fresh):
+                self._json_cache[user_ids[i]] = (schemas[i], dump)
+                dumps[i] = dump
+        return dumps
+
+    def _cached_schema(self, user_id: str) -> UserAPISchema:
+        """
+        Get a user's API schema, reusing the last one built unless the
+        user has changed since (or one of their favorites has been
+        deleted). Raises KeyError if the user doesn't exist.
+        """
+        return self._cached_schemas([user_id])[0]
+
+    def _cached_schemas(self, user_ids: List[str]) -> List[UserAPISchema]:
+        """
+        _cached_schema for many users at once: schemas that need
+        rebuilding are validated together in one pydantic-core call.
+        """
+
+        movies = movie_controller_instance.movie_dao.movies
+        users = self.user_dao.users
+        user_versions = self.user_dao.user_versions
+        schemas = []
+        stale = []
+        for user_id in user_ids:
+            user_dict = users[user_id]
+            version = user_versions.get(user_id, 0)
+            cached = self._api_cache.get(user_id)
+            if (cached is not None and cached[0] is user_dict and
+                    cached[1] == version and
+                    all(movie_id in movies
+                        for movie_id in user_dict.get('favorites', []))):
+                schemas.append(cached[2])
+                continue
+            stale.append((len(schemas), user_id, user_dict, version))
+            schemas.append(None)
+
+        if stale:
+            built = _USER_LIST_ADAPTER.validate_python([
+                self._drop_deleted_favorites(user_dict.copy(), movies)
+                for _, _, user_dict, _ in stale
+            ])
+            for (i, user_id, user_dict, version), schema in zip(
+                    stale, built):
+                self._api_cache[user_id] = (user_dict, version, schema)
+                schemas[i] = schema
+        return schemas
 
     def get_user_by_id(self, user_id: str) -> Optional[UserAPISchema]:
         # Validate input
@@ -331,46 +548,65 @@ class UserController:
                 detail="User ID cannot be empty"
             )
 
-        logger.debug(f"Retrieving user by ID: {user_id}")
+        logger.debug("Retrieving user by ID: %s", user_id)
         try:
-            user_dict = self.user_dao.get_user(user_id)
-            logger.debug(f"User found: {user_id} - {user_dict['username']}")
-            return self.dict_to_schema(user_dict)
+            schema = self._cached_schema(user_id)
+            logger.debug("User found: %s - %s", user_id, schema.username)
+            return schema
         except KeyError:
-            logger.warning(f"User with ID '{user_id}' not found")
+            logger.warning("User with ID '%s' not found", user_id)
             raise HTTPException(
                 status_code=404,
                 detail=f"User with ID '{user_id}' not found"
             )
 
     def get_user_model_by_id(self, user_id: str) -> User:
-        try:
-            user_dict = self.user_dao.get_user(user_id)
-            return self.dict_to_user_model(user_dict)
-        except KeyError:
+        """
+        Get a user's model, reusing the last one built unless the user has
+        changed since. Callers must treat the model as read-only.
+        """
+        # Compare against the DAO's own dict (not a get_user copy), so an
+        # unchanged user actually hits the cache
+        user_dict = self.user_dao.users.get(user_id)
+        if user_dict is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"User with ID '{user_id}' not found"
             )
 
+        version = self.user_dao.user_versions.get(user_id, 0)
+        cached = self._model_cache.get(user_id)
+        if (cached is not None and cached[0] is user_dict and
+                cached[1] == version):
+            return cached[2]
+
+        user = self.dict_to_user_model(user_dict.copy())
+        self._model_cache[user_id] = (user_dict, version, user)
+        return user
+
 
 user_controller_instance = UserController()
 
+# Responses are encoded with orjson rather than the stdlib json encoder
 router = APIRouter(
     prefix="/users",
     tags=["users"],
+    default_response_class=ORJSONResponse,
 )
 
 
+# Routes that change users.csv are plain def so FastAPI runs them in its
+# threadpool: each change is appended to the file and every hundredth one
+# compacts it with a full rewrite and an fsync, which mustn't stall the
+# event loop. login is sync too, since verifying a password hash is CPU
+# work. Routes that only read the in-memory users stay async.
 @router.post("/register", response_model=UserAPISchema, status_code=201)
 def register_user(user_data: UserCreateSchema):
     return user_controller_instance.create_user(user_data)
 
 
 @router.post("/login")
-def login(login_data: LoginSchema, response: Response):
-    from keyboard_smashers.auth import SessionManager
-
+def login(login_data: LoginSchema):
     user = user_controller_instance.authenticate_user(
         login_data.email,
         login_data.password
@@ -389,16 +625,9 @@ def login(login_data: LoginSchema, response: Response):
 
     session_token = SessionManager.create_session(user.userid)
 
-    response.set_cookie(
-        key="session_token",
-        value=session_token,
-        httponly=True,
-        secure=False,
-        samesite="lax",
-        max_age=SESSION_MAX_AGE_SECONDS
-    )
-
-    return {
+    # Returned responses don't pick up cookies set on an injected
+    # Response, so the cookie goes on the ORJSONResponse itself
+    response = ORJSONResponse({
         "message": "Login successful",
         "user": UserAPISchema(
             userid=user.userid,
@@ -408,95 +637,75 @@ def login(login_data: LoginSchema, response: Response):
             creation_date=user.creation_date,
             total_reviews=user.total_reviews,
             is_admin=user.is_admin
-        )
-    }
+        ).model_dump(mode='json')
+    })
+    response.set_cookie(
+        key="session_token",
+        value=session_token,
+        httponly=True,
+        secure=False,
+        samesite="lax",
+        max_age=SESSION_MAX_AGE_SECONDS
+    )
+    return response
 
 
 @router.post("/logout")
-def logout(
-    response: Response,
+async def logout(
     session_token: Optional[str] = Cookie(
         default=None,
         alias="session_token")):
-    from keyboard_smashers.auth import SessionManager
-
     if session_token:
         SessionManager.delete_session(session_token)
 
+    response = ORJSONResponse({"message": "Logout successful"})
     response.delete_cookie(key="session_token")
-    return {"message": "Logout successful"}
+    return response
 
 
 @router.get("/me", response_model=UserAPISchema)
-def get_current_user_info(
-
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+async def get_current_user_info(
+    current_user_id: str = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None)
 ):
-    from keyboard_smashers.auth import SessionManager
-
-    if not session_token:
-        raise HTTPException(status_code=401,
-                            detail="Not authenticated. Please login.")
-
-    user_id = SessionManager.validate_session(session_token)
-    if not user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session. Please login again.")
-
-    return user_controller_instance.get_user_by_id(user_id)
+    # get_user_by_id already 404s for a deleted user, so there is no
+    # need to build the User model first
+    return _etag_response(
+        user_controller_instance.get_user_by_id(
+            current_user_id
+        ).model_dump(mode='json'),
+        if_none_match
+    )
 
 # ---------------- PROTECTED ADMIN ONLY ENDPOINTS ----------------
 
 
 @router.get("/", response_model=List[UserAPISchema])
-def get_users(
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+async def get_users(
+    skip: int = Query(
+        DEFAULT_PAGE_OFFSET, ge=0, description="Number of users to skip"
+    ),
+    limit: Optional[int] = Query(
+        None,
+        ge=MIN_PAGE_LIMIT,
+        le=MAX_PAGE_LIMIT,
+        description="Maximum users to return (omit for all users)"
+    ),
+    _: User = Depends(get_current_admin_model)
 ):
-    from keyboard_smashers.auth import SessionManager
-
-    if not session_token:
-        raise HTTPException(status_code=401,
-                            detail="Not authenticated. Please login.")
-
-    user_id = SessionManager.validate_session(session_token)
-    if not user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session. Please login again.")
-
-    user = user_controller_instance.get_user_model_by_id(user_id)
-    if not user.is_admin:
-        raise HTTPException(
-            status_code=403,
-            detail="Admin privileges required")
-
-    return user_controller_instance.get_all_users()
+    # Schemas and dumps are cached per user; skip the response_model pass
+    return ORJSONResponse(
+        user_controller_instance.get_all_users_json(skip, limit)
+    )
 
 
 @router.get("/{user_id}", response_model=UserAPISchema)
-def get_user(
+async def get_user(
     user_id: str = Path(..., min_length=PATH_MIN_LENGTH,
                         max_length=PATH_MAX_LENGTH),
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    current_user: User = Depends(get_current_user_model)
 ):
-    from keyboard_smashers.auth import SessionManager
-
-    if not session_token:
-        raise HTTPException(status_code=401,
-                            detail="Not authenticated. Please login.")
-
-    current_user_id = SessionManager.validate_session(session_token)
-    if not current_user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session. Please login again.")
-
-    current_user = (
-        user_controller_instance.get_user_model_by_id(current_user_id)
-    )
-
-    if current_user_id != user_id and not current_user.is_admin:
+    if current_user.userid != user_id and not current_user.is_admin:
         raise HTTPException(
             status_code=403,
             detail=(
@@ -513,24 +722,9 @@ def update_user(
     user_id: str = Path(..., min_length=PATH_MIN_LENGTH,
                         max_length=PATH_MAX_LENGTH),
     user_data: UpdateUserSchema = None,
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    current_user: User = Depends(get_current_user_model)
 ):
-    from keyboard_smashers.auth import SessionManager
-
-    if not session_token:
-        raise HTTPException(status_code=401,
-                            detail="Not authenticated. Please login.")
-
-    current_user_id = SessionManager.validate_session(session_token)
-    if not current_user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session. Please login again.")
-
-    current_user = (
-        user_controller_instance.get_user_model_by_id(current_user_id)
-    )
-    if current_user_id != user_id and not current_user.is_admin:
+    if current_user.userid != user_id and not current_user.is_admin:
         raise HTTPException(
             status_code=403,
             detail="You can only update your own profile"
@@ -543,66 +737,32 @@ def update_user(
 def delete_user(
     user_id: str = Path(..., min_length=PATH_MIN_LENGTH,
                         max_length=PATH_MAX_LENGTH),
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    _: User = Depends(get_current_admin_model)
 ):
-    from keyboard_smashers.auth import SessionManager
-
-    if not session_token:
-        raise HTTPException(status_code=401,
-                            detail="Not authenticated. Please login.")
-
-    current_user_id = SessionManager.validate_session(session_token)
-    if not current_user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session. Please login again.")
-
-    user = user_controller_instance.get_user_model_by_id(current_user_id)
-    if not user or not user.is_admin:
-        raise HTTPException(
-            status_code=403,
-            detail="Admin privileges required")
-
-    return user_controller_instance.delete_user_by_id(user_id)
+    return ORJSONResponse(user_controller_instance.delete_user_by_id(user_id))
 
 
 @router.post("/{user_id}/suspend")
 def suspend_user(
     user_id: str = Path(..., min_length=PATH_MIN_LENGTH,
                         max_length=PATH_MAX_LENGTH),
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    admin: User = Depends(get_current_admin_model)
 ):
     """
     Admin endpoint to suspend a user account.
     Suspended users cannot log in or create reviews.
     """
-    from keyboard_smashers.auth import SessionManager
-
-    if not session_token:
-        raise HTTPException(status_code=401,
-                            detail="Not authenticated. Please login.")
-
-    current_user_id = SessionManager.validate_session(session_token)
-    if not current_user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session. Please login again.")
-
-    user = user_controller_instance.get_user_model_by_id(current_user_id)
-    if not user or not user.is_admin:
-        raise HTTPException(
-            status_code=403,
-            detail="Admin privileges required")
-
     try:
         user_controller_instance.user_dao.suspend_user(user_id)
         # Invalidate all active sessions for the suspended user
         SessionManager.invalidate_user_sessions(user_id)
         logger.info(
-            f"Admin {current_user_id} suspended user {user_id} "
-            f"and invalidated their sessions"
+            "Admin %s suspended user %s and invalidated their sessions",
+            admin.userid, user_id
+        )
+        return ORJSONResponse(
+            {"message": f"User {user_id} has been suspended"}
         )
-        return {"message": f"User {user_id} has been suspended"}
     except KeyError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -611,32 +771,16 @@ def suspend_user(
 def reactivate_user(
     user_id: str = Path(..., min_length=PATH_MIN_LENGTH,
                         max_length=PATH_MAX_LENGTH),
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    _: User = Depends(get_current_admin_model)
 ):
     """
     Admin endpoint to reactivate a suspended user account.
     """
-    from keyboard_smashers.auth import SessionManager
-
-    if not session_token:
-        raise HTTPException(status_code=401,
-                            detail="Not authenticated. Please login.")
-
-    current_user_id = SessionManager.validate_session(session_token)
-    if not current_user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session. Please login again.")
-
-    user = user_controller_instance.get_user_model_by_id(current_user_id)
-    if not user or not user.is_admin:
-        raise HTTPException(
-            status_code=403,
-            detail="Admin privileges required")
-
     try:
         user_controller_instance.user_dao.reactivate_user(user_id)
-        return {"message": f"User {user_id} has been reactivated"}
+        return ORJSONResponse(
+            {"message": f"User {user_id} has been reactivated"}
+        )
     except KeyError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -649,35 +793,21 @@ def toggle_favorite(
     movie_id: str = Path(
         ..., min_length=PATH_MIN_LENGTH, max_length=PATH_MAX_LENGTH
     ),
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    current_user_id: str = Depends(get_current_user)
 ):
     """
     Toggle a movie in/out of user's favorites list.
     Returns whether the movie was added (true) or removed (false).
     """
-    from keyboard_smashers.auth import SessionManager
-    from keyboard_smashers.controllers.movie_controller import (
-        movie_controller_instance
-    )
-
-    if not session_token:
-        raise HTTPException(status_code=401,
-                            detail="Not authenticated. Please login.")
-
-    current_user_id = SessionManager.validate_session(session_token)
-    if not current_user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session. Please login again.")
 
     if current_user_id != user_id:
         raise HTTPException(
             status_code=403,
             detail="Can only modify your own favorites")
 
-    try:
-        movie_controller_instance.movie_dao.get_movie(movie_id)
-    except KeyError:
+    # Existence check against the movie index; get_movie would copy the
+    # movie dict only for it to be discarded
+    if movie_id not in movie_controller_instance.movie_dao.movies:
         raise HTTPException(
             status_code=404,
             detail=f"Movie with ID '{movie_id}' not found")
@@ -687,15 +817,13 @@ def toggle_favorite(
             user_id, movie_id
         )
         action = "added to" if added else "removed from"
-        return {
+        return ORJSONResponse({
             "message": f"Movie {movie_id} {action} favorites",
             "added": added,
             "favorites": (
-                user_controller_instance.user_dao.get_user(user_id)[
-                    'favorites'
-                ]
+                user_controller_instance.user_dao.users[user_id]['favorites']
             )
-        }
+        })
     except KeyError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -704,34 +832,23 @@ def toggle_favorite(
 def follow_user(
     user_id: str = Path(..., min_length=PATH_MIN_LENGTH,
                         max_length=PATH_MAX_LENGTH),
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    current_user_id: str = Depends(get_current_user)
 ):
     """
     Follow a user. Authenticated user follows the specified user_id.
     Returns a success message with updated follower counts.
     """
-    from keyboard_smashers.auth import SessionManager
-
-    if not session_token:
-        raise HTTPException(status_code=401,
-                            detail="Not authenticated. Please login.")
-
-    current_user_id = SessionManager.validate_session(session_token)
-    if not current_user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session. Please login again.")
 
     try:
         user_controller_instance.user_dao.follow_user(
             current_user_id, user_id
         )
-        followee = user_controller_instance.user_dao.get_user(user_id)
-        return {
+        followee = user_controller_instance.user_dao.users[user_id]
+        return ORJSONResponse({
             "message": f"Successfully followed {followee['username']}",
             "following": user_id,
             "follower_count": len(followee.get('followers', []))
-        }
+        })
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except KeyError as e:
@@ -742,34 +859,23 @@ def follow_user(
 def unfollow_user(
     user_id: str = Path(..., min_length=PATH_MIN_LENGTH,
                         max_length=PATH_MAX_LENGTH),
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    current_user_id: str = Depends(get_current_user)
 ):
     """
     Unfollow a user. Authenticated user unfollows the specified user_id.
     Returns a success message with updated follower counts.
     """
-    from keyboard_smashers.auth import SessionManager
-
-    if not session_token:
-        raise HTTPException(status_code=401,
-                            detail="Not authenticated. Please login.")
-
-    current_user_id = SessionManager.validate_session(session_token)
-    if not current_user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session. Please login again.")
 
     try:
         user_controller_instance.user_dao.unfollow_user(
             current_user_id, user_id
         )
-        followee = user_controller_instance.user_dao.get_user(user_id)
-        return {
+        followee = user_controller_instance.user_dao.users[user_id]
+        return ORJSONResponse({
             "message": f"Successfully unfollowed {followee['username']}",
             "unfollowed": user_id,
             "follower_count": len(followee.get('followers', []))
-        }
+        })
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except KeyError as e:
@@ -777,94 +883,78 @@ def unfollow_user(
 
 
 @router.get("/{user_id}/followers")
-def get_followers(
+async def get_followers(
     user_id: str = Path(..., min_length=PATH_MIN_LENGTH,
                         max_length=PATH_MAX_LENGTH),
     limit: int = DEFAULT_PAGE_LIMIT,
-    offset: int = DEFAULT_PAGE_OFFSET
+    offset: int = DEFAULT_PAGE_OFFSET,
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     Get a paginated list of users who follow the specified user.
     No authentication required (public information).
     """
     try:
-        all_followers = user_controller_instance.user_dao.get_followers(
-            user_id
-        )
-        paginated = all_followers[offset:offset + limit]
-
-        # Convert to public schema (hide sensitive info)
-        public_followers = [
-            PublicUserSchema(
-                userid=follower['userid'],
-                username=follower['username'],
-                reputation=follower.get('reputation', DEFAULT_REPUTATION),
-                total_reviews=follower.get('total_reviews', 0),
-                favorites=follower.get('favorites', []),
-                is_admin=follower.get('is_admin', False)
-            )
-            for follower in paginated
-        ]
+        user_dao = user_controller_instance.user_dao
+        total = user_dao.get_followers_count(user_id)
+        follower_ids = user_dao.get_follower_ids(user_id, offset, limit)
 
-        return {
+        # Only the requested page is projected, straight from the user
+        # index; public fields only (hide sensitive info)
+        return _etag_response({
             "user_id": user_id,
-            "total": len(all_followers),
+            "total": total,
             "limit": limit,
             "offset": offset,
-            "followers": public_followers
-        }
+            "followers": [
+                _public_user(user_dao.users[follower_id])
+                for follower_id in follower_ids
+            ]
+        }, if_none_match)
     except KeyError as e:
         raise HTTPException(
             status_code=404,
             detail=f"User not found: {str(e)}")
     except Exception as e:
-        logger.error(f"Error getting followers for {user_id}: {str(e)}")
+        logger.error("Error getting followers for %s: %s", user_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/{user_id}/following")
-def get_following(
+async def get_following(
     user_id: str = Path(..., min_length=PATH_MIN_LENGTH,
                         max_length=PATH_MAX_LENGTH),
     limit: int = DEFAULT_PAGE_LIMIT,
-    offset: int = DEFAULT_PAGE_OFFSET
+    offset: int = DEFAULT_PAGE_OFFSET,
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     Get a paginated list of users that the specified user follows.
     No authentication required (public information).
     """
     try:
-        all_following = user_controller_instance.user_dao.get_following(
-            user_id
-        )
-        paginated = all_following[offset:offset + limit]
-
-        # Convert to public schema (hide sensitive info)
-        public_following = [
-            PublicUserSchema(
-                userid=followee['userid'],
-                username=followee['username'],
-                reputation=followee.get('reputation', DEFAULT_REPUTATION),
-                total_reviews=followee.get('total_reviews', 0),
-                favorites=followee.get('favorites', []),
-                is_admin=followee.get('is_admin', False)
-            )
-            for followee in paginated
-        ]
+        user_dao = user_controller_instance.user_dao
+        total = user_dao.get_following_count(user_id)
+        following_ids = user_dao.get_following_ids(user_id, offset, limit)
 
-        return {
+        # Only the requested page is projected, straight from the user
+        # index; public fields only (hide sensitive info)
+        return _etag_response({
             "user_id": user_id,
-            "total": len(all_following),
+            "total": total,
             "limit": limit,
             "offset": offset,
-            "following": public_following
-        }
+            "following": [
+                _public_user(user_dao.users[followee_id])
+                for followee_id in following_ids
+            ]
+        }, if_none_match)
     except KeyError as e:
         raise HTTPException(
             status_code=404,
             detail=f"User not found: {str(e)}")
     except Exception as e:
-        logger.error(f"Error getting following for {user_id}: {str(e)}")
+        logger.error("Error getting following for %s: %s", user_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -872,33 +962,21 @@ def get_following(
 def block_user(
     user_id: str = Path(..., min_length=PATH_MIN_LENGTH,
                         max_length=PATH_MAX_LENGTH),
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    current_user_id: str = Depends(get_current_user)
 ):
     """
     Block a user. Creates bidirectional block and removes follow relationships.
     Authenticated user blocks the specified user_id.
     """
-    from keyboard_smashers.auth import SessionManager
-
-    if not session_token:
-        raise HTTPException(status_code=401,
-                            detail="Not authenticated. Please login.")
-
-    current_user_id = SessionManager.validate_session(session_token)
-    if not current_user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session. Please login again.")
 
     try:
-        user_controller_instance.user_dao.block_user(
+        username = user_controller_instance.user_dao.block_user(
             current_user_id, user_id
         )
-        blocked_user = user_controller_instance.user_dao.get_user(user_id)
-        return {
-            "message": f"Successfully blocked {blocked_user['username']}",
+        return ORJSONResponse({
+            "message": f"Successfully blocked {username}",
             "blocked": user_id
-        }
+        })
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except KeyError as e:
@@ -909,33 +987,21 @@ def block_user(
 def unblock_user(
     user_id: str = Path(..., min_length=PATH_MIN_LENGTH,
                         max_length=PATH_MAX_LENGTH),
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+    current_user_id: str = Depends(get_current_user)
 ):
     """
     Unblock a user. Removes bidirectional block between users.
     Authenticated user unblocks the specified user_id.
     """
-    from keyboard_smashers.auth import SessionManager
-
-    if not session_token:
-        raise HTTPException(status_code=401,
-                            detail="Not authenticated. Please login.")
-
-    current_user_id = SessionManager.validate_session(session_token)
-    if not current_user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session. Please login again.")
 
     try:
-        user_controller_instance.user_dao.unblock_user(
+        username = user_controller_instance.user_dao.unblock_user(
             current_user_id, user_id
         )
-        unblocked_user = user_controller_instance.user_dao.get_user(user_id)
-        return {
-            "message": f"Successfully unblocked {unblocked_user['username']}",
+        return ORJSONResponse({
+            "message": f"Successfully unblocked {username}",
             "unblocked": user_id
-        }
+        })
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except KeyError as e:
@@ -943,54 +1009,40 @@ def unblock_user(
 
 
 @router.get("/me/blocked")
-def get_blocked_users(
-    session_token: Optional[str] = Cookie(default=None, alias="session_token")
+async def get_blocked_users(
+    current_user_id: str = Depends(get_current_user)
 ):
     """
     Get list of users blocked by the authenticated user.
     Returns user IDs and usernames of blocked users.
     """
-    from keyboard_smashers.auth import SessionManager
-
-    if not session_token:
-        raise HTTPException(status_code=401,
-                            detail="Not authenticated. Please login.")
-
-    current_user_id = SessionManager.validate_session(session_token)
-    if not current_user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session. Please login again.")
 
+    user_dao = user_controller_instance.user_dao
     try:
-        user = user_controller_instance.user_dao.get_user(current_user_id)
-        blocked_user_ids = user.get('blocked_users', [])
-
-        # Get details for each blocked user
-        blocked_users = []
-        for blocked_id in blocked_user_ids:
-            try:
-                blocked_user = user_controller_instance.user_dao.get_user(
-                    blocked_id
-                )
-                blocked_users.append({
-                    "userid": blocked_user['userid'],
-                    "username": blocked_user['username']
-                })
-            except KeyError:
-                # Skip if blocked user no longer exists
-                continue
-
-        return {
-            "blocked_users": blocked_users,
-            "total": len(blocked_users)
-        }
+        user = user_dao.get_user(current_user_id)
     except KeyError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
+    # Get details for each blocked user, skipping users that no longer
+    # exist; read straight from the user index rather than copying
+    blocked_users = []
+    for blocked_id in user.get('blocked_users', []):
+        blocked_user = user_dao.users.get(blocked_id)
+        if blocked_user is not None:
+            blocked_users.append({
+                "userid": blocked_user['userid'],
+                "username": blocked_user['username']
+            })
+
+    # Plain JSON types only, so skip the jsonable_encoder pass
+    return ORJSONResponse({
+        "blocked_users": blocked_users,
+        "total": len(blocked_users)
+    })
+
 
 @router.get("/search/users")
-def search_users(
+async def search_users(
     q: str = "",
     limit: int = DEFAULT_PAGE_LIMIT,
     offset: int = DEFAULT_PAGE_OFFSET
@@ -1004,6 +1056,7 @@ def search_users(
         limit: Maximum number of results (default 20)
         offset: Number of results to skip for pagination
     """
+
     if limit < MIN_PAGE_LIMIT or limit > MAX_PAGE_LIMIT:
         raise HTTPException(
             status_code=400,
@@ -1013,49 +1066,30 @@ def search_users(
             )
         )
 
-    # Get all users
-    all_users = user_controller_instance.get_all_users()
-
-    # Filter by search query if provided
-    if q:
-        query_lower = q.lower()
-        filtered_users = [
-            user for user in all_users
-            if query_lower in user.username.lower()
-        ]
-    else:
-        filtered_users = all_users
-
-    # Sort by username for consistency
-    filtered_users.sort(key=lambda u: u.username.lower())
-
-    total = len(filtered_users)
-    paginated = filtered_users[offset:offset + limit]
-
-    # Convert to public schema (hide sensitive info)
-    public_users = [
-        PublicUserSchema(
-            userid=user.userid,
-            username=user.username,
-            reputation=user.reputation,
-            total_reviews=user.total_reviews,
-            favorites=user.favorites,
-            is_admin=user.is_admin
-        )
-        for user in paginated
-    ]
+    # Match against the username index; only the page is materialized
+    userids, total = user_controller_instance.search_user_ids(
+        q, offset, limit
+    )
 
-    return {
-        "users": public_users,
+    # Public fields only (hide sensitive info), without deleted favorites
+    users = user_controller_instance.user_dao.users
+    movies = movie_controller_instance.movie_dao.movies
+    return ORJSONResponse({
+        "users": [
+            _public_user(UserController._drop_deleted_favorites(
+                users[userid].copy(), movies
+            ))
+            for userid in userids
+        ],
         "total": total,
         "limit": limit,
         "offset": offset,
         "query": q
-    }
+    })
 
 
 @router.get("/me/notifications")
-def get_my_notifications(
+async def get_my_notifications(
     session_token: str = Cookie(None, alias="session_token"),
     limit: int = DEFAULT_NOTIFICATIONS_LIMIT,
     offset: int = DEFAULT_PAGE_OFFSET
@@ -1075,25 +1109,26 @@ def get_my_notifications(
         user = user_controller_instance.user_dao.get_user(user_id)
         notifications = user.get('notifications', [])
 
-        # Sort by timestamp (most recent first)
-        sorted_notifications = sorted(
-            notifications,
-            key=lambda n: n.get('timestamp', ''),
-            reverse=True
-        )
-
-        total = len(sorted_notifications)
-        paginated = sorted_notifications[offset:offset + limit]
-
-        return {
+        # Notifications are appended as they happen, so newest-first is
+        # just the list read backwards; no sort, and only the page is
+        # copied
+        total = len(notifications)
+        start = max(offset, 0)
+        paginated = list(islice(
+            reversed(notifications), start, start + max(limit, 0)
+        ))
+
+        # orjson encodes the notification timestamps natively, so skip
+        # the jsonable_encoder pass
+        return ORJSONResponse({
             "notifications": paginated,
             "total": total,
             "unread": total,  # All notifications considered unread for now
             "limit": limit,
             "offset": offset
-        }
+        })
     except KeyError:
         raise HTTPException(status_code=404, detail="User not found")
     except Exception as e:
-        logger.error(f"Error getting notifications for {user_id}: {str(e)}")
+        logger.error("Error getting notifications for %s: %s", user_id, e)
         raise HTTPException(status_code=500, detail=str(e))
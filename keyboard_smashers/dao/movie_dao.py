@@ -1,6 +1,17 @@
-import pandas as pd
+import csv
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+# Column order of the movies CSV
+MOVIE_CSV_FIELDS = [
+    'movie_id',
+    'title',
+    'genre',
+    'year',
+    'director',
+    'description'
+]
 
 
 class MovieDAO:
@@ -8,44 +19,130 @@ class MovieDAO:
     def __init__(self, csv_path: str = "data/movies.csv"):
         self.csv_path = csv_path
         self.movies: Dict[str, Dict[str, Any]] = {}
+        # Lowercased title -> ids of movies with that title
+        self.title_index: Dict[str, List[str]] = {}
+        # Highest numeric movie id seen, so create_movie doesn't rescan
+        self.movie_counter = 0
+        # Whether new movies can be appended to the CSV as is (its
+        # header matches MOVIE_CSV_FIELDS and it ends with a newline)
+        self._append_ready = False
         self._load_movies()
 
     def _load_movies(self) -> None:
         if not Path(self.csv_path).exists():
             return
 
-        df = pd.read_csv(self.csv_path)
-        for _, row in df.iterrows():
-            movie_dict = {
-                'movie_id': str(row['movie_id']),
-                'title': row['title'],
-                'genre': row.get('genre', ''),
-                'year': int(row['year']) if pd.notna(row.get('year')) else 0,
-                'director': row.get('director', ''),
-                'description': row.get('description', '')
-            }
-            self.movies[movie_dict['movie_id']] = movie_dict
+        with open(self.csv_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            self._append_ready = header == MOVIE_CSV_FIELDS
+
+            # Resolve column positions once; columns missing from the
+            # file point past the header and read as ''
+            width = len(header)
+            col = {name: i for i, name in enumerate(header)}
+            for name in MOVIE_CSV_FIELDS:
+                if name not in col:
+                    col[name] = width
+                    width += 1
+            (i_movie_id, i_title, i_genre, i_year,
+             i_director, i_description) = [
+                col[name] for name in MOVIE_CSV_FIELDS
+            ]
+
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+                year = row[i_year]
+                movie_id = row[i_movie_id]
+                if movie_id.isdigit():
+                    self.movie_counter = max(
+                        self.movie_counter, int(movie_id)
+                    )
+                self.movies[movie_id] = {
+                    'movie_id': movie_id,
+                    'title': row[i_title],
+                    'genre': row[i_genre],
+                    # Years are written as plain integers; only files
+                    # saved through pandas carry a float form like 2010.0
+                    'year': (
+                        int(year) if year.isdecimal()
+                        else int(float(year)) if year else 0
+                    ),
+                    'director': row[i_director],
+                    'description': row[i_description]
+                }
+
+        if self._append_ready:
+            with open(self.csv_path, 'rb') as f:
+                f.seek(-1, 2)
+                self._append_ready = f.read(1) == b'\n'
+
+        self.title_index = {}
+        for movie_id, movie in self.movies.items():
+            self._index_title(movie_id, movie['title'])
+
+    @staticmethod
+    def _title_key(title: Any) -> Optional[str]:
+        return title.lower() if isinstance(title, str) else None
+
+    def _index_title(self, movie_id: str, title: Any) -> None:
+        key = self._title_key(title)
+        if key is not None:
+            self.title_index.setdefault(key, []).append(movie_id)
+
+    def _unindex_title(self, movie_id: str, title: Any) -> None:
+        key = self._title_key(title)
+        ids = self.title_index.get(key)
+        if ids and movie_id in ids:
+            ids.remove(movie_id)
+            if not ids:
+                del self.title_index[key]
+
+    def find_movie_id_by_title(
+        self, title: str, exclude_id: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get the id of a movie with this title (case-insensitive), or
+        None. exclude_id skips one movie, e.g. the one being renamed.
+        """
+        key = self._title_key(title)
+        for movie_id in self.title_index.get(key, []):
+            movie = self.movies.get(movie_id)
+            if (movie_id != exclude_id and movie is not None and
+                    self._title_key(movie['title']) == key):
+                return movie_id
+        return None
 
     def _save_movies(self) -> None:
-        if not self.movies:
-            df = pd.DataFrame(
-                columns=[
-                    'movie_id', 'title', 'genre', 'year',
-                    'director', 'description'
-                ]
-            )
-        else:
-            movies_data = list(self.movies.values())
-            df = pd.DataFrame(movies_data)
-
         Path(self.csv_path).parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(self.csv_path, index=False)
+        with open(self.csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(MOVIE_CSV_FIELDS)
+            to_row = itemgetter(*MOVIE_CSV_FIELDS)
+            writer.writerows(to_row(movie) for movie in self.movies.values())
+        self._append_ready = True
+
+    def _append_movie(self, movie: Dict[str, Any]) -> None:
+        """
+        Add one new movie to the CSV with a single-row append. Other
+        readers (e.g. ReviewDAO's title lookup) read movies.csv as a
+        plain table, so updates and deletes still rewrite the file.
+        """
+        if not self._append_ready:
+            self._save_movies()
+            return
+        with open(self.csv_path, 'a', encoding='utf-8', newline='') as f:
+            csv.writer(f).writerow(
+                [movie[name] for name in MOVIE_CSV_FIELDS]
+            )
 
     def create_movie(self, movie_data: Dict[str, Any]) -> Dict[str, Any]:
         # Auto-generate movie_id
-        existing_ids = [int(mid)
-                        for mid in self.movies.keys() if mid.isdigit()]
-        movie_id = str(max(existing_ids) + 1) if existing_ids else "1"
+        self.movie_counter += 1
+        movie_id = str(self.movie_counter)
 
         if movie_id in self.movies:
             raise ValueError(f"Movie with id {movie_id} already exists")
@@ -60,7 +157,8 @@ class MovieDAO:
         }
 
         self.movies[movie_id] = movie_dict
-        self._save_movies()
+        self._index_title(movie_id, movie_dict['title'])
+        self._append_movie(movie_dict)
         return movie_dict.copy()
 
     def get_movie(self, movie_id: str) -> Dict[str, Any]:
@@ -69,7 +167,14 @@ class MovieDAO:
             raise KeyError(f"Movie with id {movie_id} not found")
         return self.movies[movie_id].copy()
 
-    def get_all_movies(self) -> List[Dict[str, Any]]:
+    def get_all_movies(self, copy: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get every movie. With copy=False the stored dicts themselves are
+        returned, for read-only callers that would otherwise copy each
+        movie just to read a few fields; they must not be mutated.
+        """
+        if not copy:
+            return list(self.movies.values())
         return [movie.copy() for movie in self.movies.values()]
 
     def update_movie(
@@ -83,7 +188,9 @@ class MovieDAO:
 
         # Update only provided fields
         if 'title' in data:
+            self._unindex_title(movie_id, movie['title'])
             movie['title'] = data['title']
+            self._index_title(movie_id, movie['title'])
         if 'genre' in data:
             movie['genre'] = data['genre']
         if 'director' in data:
@@ -101,5 +208,5 @@ class MovieDAO:
         if movie_id not in self.movies:
             raise KeyError(f"Movie with id {movie_id} not found")
 
-        del self.movies[movie_id]
+        self._unindex_title(movie_id, self.movies.pop(movie_id)['title'])
         self._save_movies()
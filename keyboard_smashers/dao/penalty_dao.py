@@ -7,14 +7,40 @@ from keyboard_smashers.models.penalty_model import Penalty
 
 logger = logging.getLogger(__name__)
 
+# Column order of the penalties CSV. Like the users CSV it is an
+# append-only log: each mutation appends the penalty's latest state (or
+# a delete marker) and the last row per penalty_id wins on load.
+PENALTY_CSV_FIELDS = [
+    'operation',
+    'penalty_id',
+    'user_id',
+    'reason',
+    'severity',
+    'start_date',
+    'end_date',
+    'issued_by',
+    'created_at'
+]
+
 
 class PenaltyDAO:
 
     def __init__(self, csv_path: str = "data/penalties.csv"):
         self.csv_path = csv_path
         self.penalties: Dict[str, Penalty] = {}
-        self.user_penalties: Dict[str, List[str]] = {}
+        # user_id -> that user's penalties, as the Penalty objects
+        # themselves so per-user reads need no lookups by id
+        self.user_penalties: Dict[str, List[Penalty]] = {}
+        # user_id -> penalties not yet known to have ended. Ended ones
+        # are pruned on read, so active lookups skip history
+        self.unexpired_penalties: Dict[str, List[Penalty]] = {}
         self.penalty_counter = 1
+        # Whether the CSV header supports appends (legacy files without
+        # an 'operation' column are rewritten on first save)
+        self._log_ready = False
+        # Operation counter for auto-compaction
+        self._operation_count = 0
+        self._compact_threshold = 100  # Compact after this many operations
         self.load_penalties()
 
     def load_penalties(self) -> None:
@@ -24,38 +50,76 @@ class PenaltyDAO:
             return
 
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            row_count = 0
+            # Penalties issued together share timestamps, so parse each
+            # distinct ISO string once (datetimes are immutable)
+            parsed_dates: Dict[str, datetime] = {}
+
+            def parse_date(value: str) -> datetime:
+                parsed = parsed_dates.get(value)
+                if parsed is None:
+                    parsed = parsed_dates[value] = datetime.fromisoformat(
+                        value
+                    )
+                return parsed
+
+            with open(self.csv_path, 'r', encoding='utf-8', newline='',
+                      buffering=1 << 20) as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                self._log_ready = 'operation' in header
+
+                # Resolve column positions once; columns missing from
+                # older files point past the header and read as ''
+                width = len(header)
+                col = {name: i for i, name in enumerate(header)}
+                has_issued_by = 'issued_by' in col
+                for name in PENALTY_CSV_FIELDS:
+                    if name not in col:
+                        col[name] = width
+                        width += 1
+                (i_operation, i_penalty_id, i_user_id, i_reason, i_severity,
+                 i_start_date, i_end_date, i_issued_by, i_created_at) = [
+                    col[name] for name in PENALTY_CSV_FIELDS
+                ]
+
                 for row in reader:
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row.extend([''] * (width - len(row)))
+                    row_count += 1
+                    if row[i_operation] == 'delete':
+                        removed = self.penalties.pop(row[i_penalty_id], None)
+                        if removed is not None:
+                            self._unindex_penalty(removed)
+                        continue
+                    end_date = row[i_end_date]
+                    penalty_id = row[i_penalty_id]
                     penalty = Penalty(
-                        penalty_id=row['penalty_id'],
-                        user_id=row['user_id'],
-                        reason=row['reason'],
-                        severity=int(row['severity']),
-                        start_date=datetime.fromisoformat(row['start_date']),
-                        end_date=datetime.fromisoformat(row['end_date'])
-                        if row.get('end_date') else None,
-                        issued_by=row.get('issued_by'),
-                        created_at=datetime.fromisoformat(row['created_at'])
+                        penalty_id=penalty_id,
+                        user_id=row[i_user_id],
+                        reason=row[i_reason],
+                        severity=int(row[i_severity]),
+                        start_date=parse_date(row[i_start_date]),
+                        end_date=parse_date(end_date) if end_date else None,
+                        issued_by=row[i_issued_by] if has_issued_by else None,
+                        created_at=parse_date(row[i_created_at])
                     )
 
+                    # Later rows supersede earlier ones for the same id
+                    previous = self.penalties.get(penalty.penalty_id)
+                    if previous is not None:
+                        self._unindex_penalty(previous)
                     self.penalties[penalty.penalty_id] = penalty
+                    self._index_penalty(penalty)
 
-                    if penalty.user_id not in self.user_penalties:
-                        self.user_penalties[penalty.user_id] = []
-                    self.user_penalties[penalty.user_id].append(
-                        penalty.penalty_id
-                    )
-
-                    if penalty.penalty_id.startswith("penalty_"):
-                        try:
-                            penalty_num = int(penalty.penalty_id.split("_")[1])
-                            self.penalty_counter = max(
-                                self.penalty_counter,
-                                penalty_num + 1
-                            )
-                        except (IndexError, ValueError):
-                            pass
+                    # Reserve ids past every penalty_NNN seen
+                    if (penalty_id.startswith("penalty_") and
+                            penalty_id[8:].isdecimal()):
+                        self.penalty_counter = max(
+                            self.penalty_counter, int(penalty_id[8:]) + 1
+                        )
 
             logger.info(
                 f"Loaded {len(self.penalties)} penalties from {self.csv_path}"
@@ -64,27 +128,73 @@ class PenaltyDAO:
             logger.error(f"Error loading penalties from {self.csv_path}: {e}")
             raise
 
+        # Compact on startup if superseded rows have piled up
+        if row_count - len(self.penalties) > self._compact_threshold:
+            logger.info(
+                f"Compacting penalties on startup ({row_count} operations)"
+            )
+            self.save_penalties()
+
+    @staticmethod
+    def _has_ended(penalty: Penalty, now: datetime) -> bool:
+        return penalty.end_date is not None and now > penalty.end_date
+
+    def _track_unexpired(self, penalty: Penalty) -> None:
+        if self._has_ended(penalty, datetime.now()):
+            return
+        penalties = self.unexpired_penalties.setdefault(penalty.user_id, [])
+        if penalty not in penalties:
+            penalties.append(penalty)
+
+    def _index_penalty(self, penalty: Penalty) -> None:
+        if penalty.user_id not in self.user_penalties:
+            self.user_penalties[penalty.user_id] = []
+        self.user_penalties[penalty.user_id].append(penalty)
+        self._track_unexpired(penalty)
+
+    def _unindex_penalty(self, penalty: Penalty) -> None:
+        # Penalty has no __eq__, so membership and remove go by identity
+        for index in (self.user_penalties, self.unexpired_penalties):
+            penalties = index.get(penalty.user_id)
+            if penalties and penalty in penalties:
+                penalties.remove(penalty)
+                if not penalties:
+                    del index[penalty.user_id]
+
+    @staticmethod
+    def _penalty_to_row(
+        penalty: Penalty, operation: str = 'upsert'
+    ) -> List[Any]:
+        """Serialize a penalty into a penalties CSV row, in field order"""
+        if operation == 'delete':
+            return [operation, penalty.penalty_id] + [''] * (
+                len(PENALTY_CSV_FIELDS) - 2
+            )
+        return [operation, *penalty.to_row()]
+
     def save_penalties(self) -> None:
+        """
+        Rewrite the penalties CSV with one row per current penalty. Used
+        for compaction; individual mutations go through _append_penalties.
+        """
         try:
             csv_file = Path(self.csv_path)
             csv_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(csv_file, 'w', encoding='utf-8', newline='') as f:
-                fieldnames = [
-                    'penalty_id',
-                    'user_id',
-                    'reason',
-                    'severity',
-                    'start_date',
-                    'end_date',
-                    'issued_by',
-                    'created_at'
-                ]
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
+            with open(csv_file, 'w', encoding='utf-8', newline='',
+                      buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(PENALTY_CSV_FIELDS)
 
-                for penalty in self.penalties.values():
-                    writer.writerow(penalty.to_dict())
+                # One writerows call over plain rows instead of a
+                # DictWriter.writerow per penalty
+                writer.writerows(
+                    self._penalty_to_row(penalty)
+                    for penalty in self.penalties.values()
+                )
+
+            self._log_ready = True
+            self._operation_count = 0
 
             logger.info(
                 f"Saved {len(self.penalties)} penalties to {self.csv_path}"
@@ -93,6 +203,33 @@ class PenaltyDAO:
             logger.error(f"Error saving penalties to CSV: {e}")
             raise
 
+    def _append_penalties(
+        self, penalties: List[Penalty], operation: str = 'upsert'
+    ) -> None:
+        """
+        Append the latest state of the given penalties (or delete
+        markers) to the penalties CSV instead of rewriting the whole file.
+        """
+        if not self._log_ready:
+            # Missing or legacy file: write it out in the log format
+            self.save_penalties()
+            return
+
+        try:
+            with open(self.csv_path, 'a', encoding='utf-8',
+                      newline='') as f:
+                csv.writer(f).writerows(
+                    self._penalty_to_row(penalty, operation)
+                    for penalty in penalties
+                )
+        except Exception as e:
+            logger.error(f"Error appending penalties to CSV: {e}")
+            raise
+
+        self._operation_count += len(penalties)
+        if self._operation_count >= self._compact_threshold:
+            self.save_penalties()
+
     def create_penalty(self, penalty_data: Dict[str, Any]) -> Penalty:
         penalty_id = f"penalty_{self.penalty_counter:03d}"
         self.penalty_counter += 1
@@ -109,14 +246,12 @@ class PenaltyDAO:
         )
 
         self.penalties[penalty_id] = penalty
+        self._index_penalty(penalty)
 
-        if penalty.user_id not in self.user_penalties:
-            self.user_penalties[penalty.user_id] = []
-        self.user_penalties[penalty.user_id].append(penalty_id)
-
-        self.save_penalties()
+        self._append_penalties([penalty])
         logger.info(f"Created penalty: {penalty_id}"
-                    f" for user {penalty.user_id}")
+                    f" for user {penalty.user_id}"
+                    f" (Severity: {penalty.severity})")
         return penalty
 
     def get_penalty(self, penalty_id: str) -> Penalty:
@@ -125,12 +260,38 @@ class PenaltyDAO:
         return self.penalties[penalty_id]
 
     def get_penalties_by_user(self, user_id: str) -> List[Penalty]:
-        penalty_ids = self.user_penalties.get(user_id, [])
-        return [self.penalties[pid] for pid in penalty_ids]
+        """
+        Get a user's penalties. This is the index list itself, not a
+        copy, so callers must not modify it.
+        """
+        return self.user_penalties.get(user_id, [])
 
     def get_active_penalties_by_user(self, user_id: str) -> List[Penalty]:
-        penalties = self.get_penalties_by_user(user_id)
-        return [p for p in penalties if p.is_active()]
+        """
+        Get a user's active penalties, looking only at penalties that
+        hadn't ended as of the last lookup. Ones that have ended since
+        are dropped from unexpired_penalties on the way.
+        """
+        penalties = self.unexpired_penalties.get(user_id)
+        if not penalties:
+            return []
+
+        now = datetime.now()
+        unexpired = []
+        active = []
+        for penalty in penalties:
+            if self._has_ended(penalty, now):
+                continue
+            unexpired.append(penalty)
+            if now >= penalty.start_date:
+                active.append(penalty)
+
+        if len(unexpired) != len(penalties):
+            if unexpired:
+                self.unexpired_penalties[user_id] = unexpired
+            else:
+                del self.unexpired_penalties[user_id]
+        return active
 
     def get_all_penalties(self) -> List[Penalty]:
         return list(self.penalties.values())
@@ -162,7 +323,11 @@ class PenaltyDAO:
                 else end_date
             )
 
-        self.save_penalties()
+        if 'end_date' in data:
+            # A later end date can bring an ended penalty back
+            self._track_unexpired(penalty)
+
+        self._append_penalties([penalty])
         logger.info(f"Updated penalty: {penalty_id}")
         return penalty
 
@@ -171,15 +336,24 @@ class PenaltyDAO:
             raise KeyError(f"Penalty with ID '{penalty_id}' not found")
 
         penalty = self.penalties[penalty_id]
-
-        if penalty.user_id in self.user_penalties:
-            self.user_penalties[penalty.user_id].remove(penalty_id)
-            if not self.user_penalties[penalty.user_id]:
-                del self.user_penalties[penalty.user_id]
+        self._unindex_penalty(penalty)
 
         del self.penalties[penalty_id]
-        self.save_penalties()
+        self._append_penalties([penalty], operation='delete')
         logger.info(f"Deleted penalty: {penalty_id}")
 
+    def delete_penalties_by_user(self, user_id: str) -> int:
+        removed = self.user_penalties.pop(user_id, [])
+        self.unexpired_penalties.pop(user_id, None)
+        for penalty in removed:
+            self.penalties.pop(penalty.penalty_id, None)
+
+        count = len(removed)
+        if count > 0:
+            self._append_penalties(removed, operation='delete')
+            logger.info(f"Deleted {count} penalties for user {user_id}")
+        return count
+
     def get_penalty_count_by_user(self, user_id: str) -> int:
-        return len(self.user_penalties.get(user_id, []))
+        penalties = self.user_penalties.get(user_id)
+        return len(penalties) if penalties else 0
@@ -1,11 +1,24 @@
 import csv
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Column order of the reports CSV. Like the users and penalties CSVs it
+# is an append-only log: each mutation appends the report's latest state
+# (or a delete marker) and the last row per report_id wins on load.
+REPORT_CSV_FIELDS = [
+    'operation',
+    'report_id',
+    'review_id',
+    'reporting_user_id',
+    'reason',
+    'admin_viewed',
+    'timestamp'
+]
+
 
 class ReportDAO:
 
@@ -16,7 +29,15 @@ class ReportDAO:
         self.reports_by_review: Dict[str, List[str]] = {}
         # Index for fast lookups by reporting user
         self.reports_by_user: Dict[str, List[str]] = {}
+        # Index for duplicate checks by (review_id, reporting_user_id)
+        self.reports_by_pair: Dict[Tuple[str, str], str] = {}
         self.report_counter = 1
+        # Whether the CSV header supports appends (legacy files without
+        # an 'operation' column are rewritten on first save)
+        self._log_ready = False
+        # Operation counter for auto-compaction
+        self._operation_count = 0
+        self._compact_threshold = 100  # Compact after this many operations
         self.load_reports()
 
     def load_reports(self) -> None:
@@ -26,46 +47,58 @@ class ReportDAO:
             return
 
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            row_count = 0
+            with open(self.csv_path, 'r', encoding='utf-8', newline='',
+                      buffering=1 << 20) as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                self._log_ready = 'operation' in header
+
+                # Resolve column positions once; columns missing from
+                # older files point past the header and read as ''
+                width = len(header)
+                col = {name: i for i, name in enumerate(header)}
+                for name in REPORT_CSV_FIELDS:
+                    if name not in col:
+                        col[name] = width
+                        width += 1
+                (i_operation, i_report_id, i_review_id, i_reporting_user_id,
+                 i_reason, i_admin_viewed, i_timestamp) = [
+                    col[name] for name in REPORT_CSV_FIELDS
+                ]
+
                 for row in reader:
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row.extend([''] * (width - len(row)))
+                    row_count += 1
+                    report_id = row[i_report_id]
+
+                    # Later rows supersede earlier ones for the same id
+                    previous = self.reports.pop(report_id, None)
+                    if previous is not None:
+                        self._unindex_report(previous)
+                    if row[i_operation] == 'delete':
+                        continue
+
                     report = {
-                        'report_id': row['report_id'],
-                        'review_id': row['review_id'],
-                        'reporting_user_id': row['reporting_user_id'],
-                        'reason': row.get('reason', ''),
-                        'admin_viewed': row.get(
-                            'admin_viewed', 'False'
-                        ) == 'True',
-                        'timestamp': datetime.fromisoformat(row['timestamp'])
+                        'report_id': report_id,
+                        'review_id': row[i_review_id],
+                        'reporting_user_id': row[i_reporting_user_id],
+                        'reason': row[i_reason],
+                        'admin_viewed': row[i_admin_viewed] == 'True',
+                        'timestamp': datetime.fromisoformat(row[i_timestamp])
                     }
+                    self.reports[report_id] = report
+                    self._index_report(report)
 
-                    self.reports[report['report_id']] = report
-
-                    # Index by review_id
-                    review_id = report['review_id']
-                    if review_id not in self.reports_by_review:
-                        self.reports_by_review[review_id] = []
-                    self.reports_by_review[review_id].append(
-                        report['report_id']
-                    )
-
-                    # Index by reporting_user_id
-                    user_id = report['reporting_user_id']
-                    if user_id not in self.reports_by_user:
-                        self.reports_by_user[user_id] = []
-                    self.reports_by_user[user_id].append(report['report_id'])
-
-                    # Update counter for ID generation
-                    if report['report_id'].startswith("report_"):
-                        try:
-                            report_num = int(report['report_id'].split("_")[1])
-                            self.report_counter = max(
-                                self.report_counter,
-                                report_num + 1
-                            )
-                        except (IndexError, ValueError):
-                            pass
+                    # Reserve ids past every report_NNN seen
+                    if (report_id.startswith("report_") and
+                            report_id[7:].isdecimal()):
+                        self.report_counter = max(
+                            self.report_counter, int(report_id[7:]) + 1
+                        )
 
             logger.info(
                 f"Loaded {len(self.reports)} reports from {self.csv_path}"
@@ -74,32 +107,72 @@ class ReportDAO:
             logger.error(f"Error loading reports from {self.csv_path}: {e}")
             raise
 
+        # Compact on startup if superseded rows have piled up
+        if row_count - len(self.reports) > self._compact_threshold:
+            logger.info(
+                f"Compacting reports on startup ({row_count} operations)"
+            )
+            self.save_reports()
+
+    def _index_report(self, report: Dict[str, Any]) -> None:
+        report_id = report['report_id']
+        review_id = report['review_id']
+        user_id = report['reporting_user_id']
+        self.reports_by_review.setdefault(review_id, []).append(report_id)
+        self.reports_by_user.setdefault(user_id, []).append(report_id)
+        self.reports_by_pair[(review_id, user_id)] = report_id
+
+    def _unindex_report(self, report: Dict[str, Any]) -> None:
+        report_id = report['report_id']
+        review_id = report['review_id']
+        user_id = report['reporting_user_id']
+        for index, key in ((self.reports_by_review, review_id),
+                           (self.reports_by_user, user_id)):
+            report_ids = index.get(key)
+            if report_ids and report_id in report_ids:
+                report_ids.remove(report_id)
+                if not report_ids:
+                    del index[key]
+        if self.reports_by_pair.get((review_id, user_id)) == report_id:
+            del self.reports_by_pair[(review_id, user_id)]
+
+    @staticmethod
+    def _report_to_row(
+        report: Dict[str, Any], operation: str = 'upsert'
+    ) -> Tuple[Any, ...]:
+        """Serialize a report into a reports CSV row, in field order"""
+        if operation == 'delete':
+            return (operation, report['report_id']) + ('',) * (
+                len(REPORT_CSV_FIELDS) - 2
+            )
+        return (
+            operation,
+            report['report_id'],
+            report['review_id'],
+            report['reporting_user_id'],
+            report.get('reason', ''),
+            report.get('admin_viewed', False),
+            report['timestamp'].isoformat()
+        )
+
     def save_reports(self) -> None:
         try:
             csv_file = Path(self.csv_path)
             csv_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(csv_file, 'w', encoding='utf-8', newline='') as f:
-                fieldnames = [
-                    'report_id',
-                    'review_id',
-                    'reporting_user_id',
-                    'reason',
-                    'admin_viewed',
-                    'timestamp'
-                ]
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for report in self.reports.values():
-                    writer.writerow({
-                        'report_id': report['report_id'],
-                        'review_id': report['review_id'],
-                        'reporting_user_id': report['reporting_user_id'],
-                        'reason': report.get('reason', ''),
-                        'admin_viewed': report.get('admin_viewed', False),
-                        'timestamp': report['timestamp'].isoformat()
-                    })
+            # Plain csv.writer rows in one writerows call, through a
+            # large buffer, rather than a DictWriter.writerow per report
+            with open(csv_file, 'w', encoding='utf-8', newline='',
+                      buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(REPORT_CSV_FIELDS)
+                writer.writerows(
+                    self._report_to_row(report)
+                    for report in self.reports.values()
+                )
+
+            self._log_ready = True
+            self._operation_count = 0
 
             logger.info(
                 f"Saved {len(self.reports)} reports to {self.csv_path}"
@@ -108,6 +181,33 @@ class ReportDAO:
             logger.error(f"Error saving reports to {self.csv_path}: {e}")
             raise
 
+    def _append_reports(
+        self, reports: List[Dict[str, Any]], operation: str = 'upsert'
+    ) -> None:
+        """
+        Append the latest state of the given reports (or delete markers)
+        to the reports CSV instead of rewriting the whole file.
+        """
+        if not self._log_ready:
+            # Missing or legacy file: write it out in the log format
+            self.save_reports()
+            return
+
+        try:
+            with open(self.csv_path, 'a', encoding='utf-8',
+                      newline='') as f:
+                csv.writer(f).writerows(
+                    self._report_to_row(report, operation)
+                    for report in reports
+                )
+        except Exception as e:
+            logger.error(f"Error appending reports to {self.csv_path}: {e}")
+            raise
+
+        self._operation_count += len(reports)
+        if self._operation_count >= self._compact_threshold:
+            self.save_reports()
+
     def create_report(
         self,
         review_id: str,
@@ -128,17 +228,9 @@ class ReportDAO:
         }
 
         self.reports[report_id] = report
+        self._index_report(report)
 
-        # Update indexes
-        if review_id not in self.reports_by_review:
-            self.reports_by_review[review_id] = []
-        self.reports_by_review[review_id].append(report_id)
-
-        if reporting_user_id not in self.reports_by_user:
-            self.reports_by_user[reporting_user_id] = []
-        self.reports_by_user[reporting_user_id].append(report_id)
-
-        self.save_reports()
+        self._append_reports([report])
         logger.info(
             f"Created report {report_id} for review {review_id} "
             f"by user {reporting_user_id}"
@@ -181,49 +273,55 @@ class ReportDAO:
         reporting_user_id: str
     ) -> bool:
         """Check if a user has already reported a specific review"""
-        reports = self.get_reports_by_review(review_id)
-        return any(
-            report['reporting_user_id'] == reporting_user_id
-            for report in reports
-        )
+        return (review_id, reporting_user_id) in self.reports_by_pair
 
     def delete_reports_by_review(self, review_id: str) -> int:
         """Delete all reports for a specific review (cascade delete)"""
-        report_ids = self.reports_by_review.get(review_id, [])
-        count = len(report_ids)
+        report_ids = self.reports_by_review.pop(review_id, [])
+        removed = []
 
         for report_id in report_ids:
-            report = self.reports.get(report_id)
-            if report:
-                # Remove from user index
-                user_id = report['reporting_user_id']
-                if user_id in self.reports_by_user:
-                    if report_id in self.reports_by_user[user_id]:
-                        self.reports_by_user[user_id].remove(report_id)
-
-                # Remove from reports dict
-                del self.reports[report_id]
-
-        # Remove review from index
-        if review_id in self.reports_by_review:
-            del self.reports_by_review[review_id]
+            report = self.reports.pop(report_id, None)
+            if report is not None:
+                self._unindex_report(report)
+                removed.append(report)
 
+        count = len(report_ids)
         if count > 0:
-            self.save_reports()
+            self._append_reports(removed, 'delete')
             logger.info(
                 f"Deleted {count} reports for review {review_id}"
             )
 
         return count
 
+    def delete_reports_by_user(self, user_id: str) -> int:
+        """Delete all reports filed by a user (cascade delete)"""
+        report_ids = self.reports_by_user.pop(user_id, [])
+        removed = []
+
+        for report_id in report_ids:
+            report = self.reports.pop(report_id, None)
+            if report is not None:
+                self._unindex_report(report)
+                removed.append(report)
+
+        count = len(report_ids)
+        if count > 0:
+            self._append_reports(removed, 'delete')
+            logger.info(f"Deleted {count} reports by user {user_id}")
+
+        return count
+
     def mark_as_viewed(self, report_id: str) -> bool:
         """Mark a report as viewed by an admin"""
         if report_id not in self.reports:
             logger.warning(f"Report {report_id} not found")
             return False
 
-        self.reports[report_id]['admin_viewed'] = True
-        self.save_reports()
+        report = self.reports[report_id]
+        report['admin_viewed'] = True
+        self._append_reports([report])
         logger.info(f"Report {report_id} marked as viewed")
         return True
 
@@ -233,29 +331,9 @@ class ReportDAO:
             logger.warning(f"Report {report_id} not found")
             return False
 
-        report = self.reports[report_id]
-        review_id = report['review_id']
-        user_id = report['reporting_user_id']
+        report = self.reports.pop(report_id)
+        self._unindex_report(report)
 
-        # Remove from review index
-        if review_id in self.reports_by_review:
-            if report_id in self.reports_by_review[review_id]:
-                self.reports_by_review[review_id].remove(report_id)
-            # Clean up empty lists
-            if not self.reports_by_review[review_id]:
-                del self.reports_by_review[review_id]
-
-        # Remove from user index
-        if user_id in self.reports_by_user:
-            if report_id in self.reports_by_user[user_id]:
-                self.reports_by_user[user_id].remove(report_id)
-            # Clean up empty lists
-            if not self.reports_by_user[user_id]:
-                del self.reports_by_user[user_id]
-
-        # Remove from reports dict
-        del self.reports[report_id]
-
-        self.save_reports()
+        self._append_reports([report], 'delete')
         logger.info(f"Deleted report {report_id}")
         return True
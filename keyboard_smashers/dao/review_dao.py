@@ -1,12 +1,21 @@
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-from threading import Lock
+from threading import RLock
 import logging
+import heapq
 
 logger = logging.getLogger(__name__)
 
+# The only IMDB dataset columns the loader reads; vote counts and review
+# titles are skipped at parse time rather than loaded and dropped
+IMDB_REVIEW_COLUMNS = frozenset({
+    'Date of Review', 'User', "User's Rating out of 10", 'Review', 'movie'
+})
+MOVIE_TITLE_COLUMNS = frozenset({'movie_id', 'title'})
+
 
 class ReviewDAO:
 
@@ -18,9 +27,13 @@ class ReviewDAO:
         # Indexed lookups for fast filtering
         self.reviews_by_movie: Dict[str, List[str]] = {}
         self.reviews_by_user: Dict[str, List[str]] = {}
-        # Thread safety lock for concurrent operations
-        self._lock = Lock()
-        # Cached max review ID (initialized after loading)
+        # Per-movie change counters so callers can detect stale caches
+        self.movie_versions: Dict[str, int] = {}
+        # Thread safety lock for concurrent operations; reentrant because
+        # writes that cross the compaction threshold call compact_reviews
+        # while still holding it
+        self._lock = RLock()
+        # Highest review id seen, tracked while loading
         self._max_review_id = 0
         # Operation counter for auto-compaction
         self._operation_count = 0
@@ -35,101 +48,164 @@ class ReviewDAO:
         movie_title_to_id = {}
         movies_csv_path = 'data/movies.csv'
         if Path(movies_csv_path).exists():
-            movies_df = pd.read_csv(movies_csv_path)
-            for _, movie_row in movies_df.iterrows():
-                title = str(movie_row.get('title', '')).strip()
-                movie_id = str(movie_row.get('movie_id', ''))
-                movie_title_to_id[title] = movie_id
+            movies_df = pd.read_csv(
+                movies_csv_path, usecols=MOVIE_TITLE_COLUMNS.__contains__
+            )
+            titles = self._str_column(movies_df, 'title').str.strip()
+            movie_ids = self._str_column(movies_df, 'movie_id')
+            movie_title_to_id = dict(zip(titles, movie_ids))
 
-        # Load original IMDB reviews (read-only)
+        # Load original IMDB reviews (read-only), column-wise rather
+        # than row by row
         if Path(self.imdb_csv_path).exists():
-            df = pd.read_csv(self.imdb_csv_path)
+            df = pd.read_csv(
+                self.imdb_csv_path, usecols=IMDB_REVIEW_COLUMNS.__contains__
+            )
 
-            for idx, row in df.iterrows():
+            # Convert rating from 0-10 to 1-5 scale (3 if missing/invalid)
+            rating_column = "User's Rating out of 10"
+            if rating_column in df.columns:
+                raw_ratings = pd.to_numeric(
+                    df[rating_column], errors='coerce'
+                )
+            else:
+                raw_ratings = pd.Series(0, index=df.index)
+            ratings = (raw_ratings / 2).round().clip(1, 5).fillna(3)
+
+            # Truncate review text to 250 chars if needed
+            review_texts = self._str_column(df, 'Review', '').str[:250]
+
+            # Map movie title to numeric ID (fallback to title). Titles
+            # repeat heavily, so factorize and resolve each distinct
+            # title once, then expand back out by code.
+            if 'movie' in df.columns:
+                codes, titles = pd.factorize(
+                    df['movie'], use_na_sentinel=False
+                )
+            else:
+                codes, titles = np.zeros(len(df), dtype=np.intp), ['']
+            # Several titles can resolve to the same movie (e.g. after
+            # stripping), so each code points at a shared per-movie
+            # list and the loop below appends by code, not by key.
+            unique_ids = np.empty(len(titles), dtype=object)
+            movie_lists: Dict[str, List[str]] = {}
+            lists_by_code = []
+            for code, title in enumerate(titles):
+                title = str(title).strip()
+                movie_id = movie_title_to_id.get(title, title)
+                unique_ids[code] = movie_id
+                lists_by_code.append(movie_lists.setdefault(movie_id, []))
+
+            usernames = self._str_column(df, 'User', '')
+            review_dates = self._str_column(df, 'Date of Review', '')
+
+            for idx, (code, username, rating, text, date) in enumerate(
+                zip(codes, usernames.to_numpy(),
+                    ratings.to_numpy(), review_texts.to_numpy(),
+                    review_dates.to_numpy())
+            ):
                 # Generate sequential review IDs
                 review_id = f"review_{str(idx).zfill(6)}"
-
-                # Extract rating (convert from 0-10 to 1-5 scale)
-                raw_rating = row.get("User's Rating out of 10", 0)
-                if pd.notna(raw_rating):
-                    try:
-                        rating = max(1, min(5, round(float(raw_rating) / 2)))
-                    except (ValueError, TypeError):
-                        rating = 3
-                else:
-                    rating = 3
-
-                # Truncate review text to 250 chars if needed
-                review_text = str(row.get('Review', ''))[
-                    :250] if pd.notna(row.get('Review')) else ''
-
-                # Map movie title to numeric ID
-                movie_title = str(row.get('movie', '')).strip()
-                movie_id = movie_title_to_id.get(
-                    movie_title, movie_title)  # Fallback to title if not found
-
-                review_dict = {
+                self.reviews[review_id] = {
                     'review_id': review_id,
-                    'movie_id': movie_id,
+                    'movie_id': unique_ids[code],
                     'user_id': None,  # Legacy IMDB reviews
-                    'imdb_username': (
-                        str(row.get('User', ''))
-                        if pd.notna(row.get('User')) else ''
-                    ),
-                    'rating': rating,
-                    'review_text': review_text,
-                    'review_date': (
-                        str(row.get('Date of Review', ''))
-                        if pd.notna(row.get('Date of Review')) else ''
-                    )
+                    'imdb_username': username,
+                    'rating': int(rating),
+                    'review_text': text,
+                    'review_date': date
                 }
-
-                self._add_review_to_indexes(review_id, review_dict)
+                lists_by_code[code].append(review_id)
+            # IMDB ids are sequential, so the highest is the last one
+            self._max_review_id = max(self._max_review_id, len(df) - 1)
+
+            for movie_id, review_ids in movie_lists.items():
+                if review_ids:
+                    self.reviews_by_movie.setdefault(
+                        movie_id, []
+                    ).extend(review_ids)
+                    self.movie_versions[movie_id] = (
+                        self.movie_versions.get(movie_id, 0) + 1
+                    )
 
         # Load new reviews from users (append-only file)
         if Path(self.new_reviews_csv_path).exists():
             df = pd.read_csv(self.new_reviews_csv_path)
 
-            for _, row in df.iterrows():
-                review_id = str(row['review_id'])
-                operation = row.get('operation', 'create')
-
+            # Walk the columns together instead of building a Series per
+            # row with iterrows; values match the old str()/notna handling
+            if 'operation' in df.columns:
+                operations = df['operation'].to_numpy()
+            else:
+                operations = np.full(len(df), 'create', dtype=object)
+            if 'rating' in df.columns:
+                ratings = df['rating'].to_numpy()
+            else:
+                ratings = np.full(len(df), 3)
+
+            for (review_id, operation, movie_id, user_id, imdb_username,
+                 rating, review_text, review_date) in zip(
+                    self._str_column(df, 'review_id').to_numpy(),
+                    operations,
+                    self._str_column(df, 'movie_id').to_numpy(),
+                    self._optional_str_column(df, 'user_id'),
+                    self._optional_str_column(df, 'imdb_username'),
+                    ratings,
+                    self._str_column(df, 'review_text').to_numpy(),
+                    self._str_column(df, 'review_date').to_numpy()
+            ):
+                # Track the highest id while replaying, deleted ones
+                # included, rather than scanning every review afterwards
+                if (review_id.startswith('review_') and
+                        review_id[7:].isdecimal()):
+                    self._max_review_id = max(
+                        self._max_review_id, int(review_id[7:])
+                    )
                 if operation == 'delete':
                     # Remove from memory
                     self._remove_review_from_indexes(review_id)
                 else:
                     # Create or update (latest entry wins)
-                    user_id_val = row.get('user_id')
-                    imdb_user_val = row.get('imdb_username')
-
                     review_dict = {
                         'review_id': review_id,
-                        'movie_id': str(row.get('movie_id', '')),
-                        'user_id': (
-                            str(user_id_val)
-                            if pd.notna(user_id_val) else None
-                        ),
-                        'imdb_username': (
-                            str(imdb_user_val)
-                            if pd.notna(imdb_user_val) else None
-                        ),
-                        'rating': int(row.get('rating', 3)),
-                        'review_text': str(row.get('review_text', '')),
-                        'review_date': str(row.get('review_date', ''))
+                        'movie_id': movie_id,
+                        'user_id': user_id,
+                        'imdb_username': imdb_username,
+                        'rating': int(rating),
+                        'review_text': review_text,
+                        'review_date': review_date
                     }
                     self._add_review_to_indexes(review_id, review_dict)
 
-        # Initialize cached max review ID
-        self._initialize_max_review_id()
-
-    def _initialize_max_review_id(self) -> None:
-        """Initialize the max review ID counter from existing reviews"""
-        existing_ids = [
-            int(rid.replace('review_', ''))
-            for rid in self.reviews.keys()
-            if rid.startswith('review_')
+    @staticmethod
+    def _str_column(
+        df: pd.DataFrame, column: str, na_value: Optional[str] = None
+    ) -> pd.Series:
+        """
+        Get a column as strings. Missing values become na_value, or
+        'nan' like str() would give when na_value is None.
+        """
+        if column not in df.columns:
+            return pd.Series('' if na_value is None else na_value,
+                             index=df.index, dtype=object)
+        values = df[column]
+        # Newer pandas keeps NaN through astype(str), so fill explicitly
+        return values.astype(str).where(
+            values.notna(), 'nan' if na_value is None else na_value
+        )
+
+    @staticmethod
+    def _optional_str_column(df: pd.DataFrame, column: str) -> List[Any]:
+        """Get a column as strings, with None for missing values"""
+        if column not in df.columns:
+            return [None] * len(df)
+        values = df[column]
+        return [
+            string if present else None
+            for string, present in zip(
+                values.astype(str).tolist(), values.notna().tolist()
+            )
         ]
-        self._max_review_id = max(existing_ids) if existing_ids else 0
 
     def _maybe_compact_on_startup(self) -> None:
         """Compact reviews file on startup if it has grown large"""
@@ -144,9 +220,9 @@ class ReviewDAO:
         except Exception as e:
             logger.warning(f"Failed to check/compact on startup: {e}")
 
-    def _maybe_compact(self) -> None:
+    def _maybe_compact(self, operations: int = 1) -> None:
         """Trigger compaction if operation threshold is reached"""
-        self._operation_count += 1
+        self._operation_count += operations
         if self._operation_count >= self._compact_threshold:
             logger.info(
                 f"Auto-compacting after {self._operation_count} operations")
@@ -156,23 +232,51 @@ class ReviewDAO:
     def _add_review_to_indexes(
             self, review_id: str, review_dict: Dict[str, Any]) -> None:
         """Add or update a review in memory and indexes"""
+        previous = self.reviews.get(review_id)
+
         # Add to main dictionary
         self.reviews[review_id] = review_dict
 
-        # Build movie index
+        # Build movie index. A review already indexed under the same
+        # movie/user stays where it is, so adds never scan the lists.
         movie_id = review_dict['movie_id']
-        if movie_id not in self.reviews_by_movie:
-            self.reviews_by_movie[movie_id] = []
-        if review_id not in self.reviews_by_movie[movie_id]:
-            self.reviews_by_movie[movie_id].append(review_id)
+        self.movie_versions[movie_id] = (
+            self.movie_versions.get(movie_id, 0) + 1
+        )
+        old_movie_id = previous['movie_id'] if previous else None
+        if old_movie_id != movie_id:
+            if old_movie_id is not None:
+                self.movie_versions[old_movie_id] = (
+                    self.movie_versions.get(old_movie_id, 0) + 1
+                )
+                self._unlink(self.reviews_by_movie, old_movie_id, review_id)
+            self.reviews_by_movie.setdefault(movie_id, []).append(review_id)
 
         # Build user index if user_id present
         user_id = review_dict.get('user_id')
-        if user_id:
-            if user_id not in self.reviews_by_user:
-                self.reviews_by_user[user_id] = []
-            if review_id not in self.reviews_by_user[user_id]:
-                self.reviews_by_user[user_id].append(review_id)
+        old_user_id = previous.get('user_id') if previous else None
+        if old_user_id != user_id:
+            if old_user_id:
+                self._unlink(self.reviews_by_user, old_user_id, review_id)
+            if user_id:
+                self.reviews_by_user.setdefault(user_id, []).append(
+                    review_id
+                )
+
+    @staticmethod
+    def _unlink(
+        index: Dict[str, List[str]], key: str, review_id: str
+    ) -> None:
+        """Remove review_id from index[key], dropping the key if emptied"""
+        ids = index.get(key)
+        if not ids:
+            return
+        try:
+            ids.remove(review_id)
+        except ValueError:
+            return
+        if not ids:
+            del index[key]
 
     def _remove_review_from_indexes(self, review_id: str) -> None:
         """Remove a review from memory and indexes"""
@@ -182,20 +286,14 @@ class ReviewDAO:
         review = self.reviews[review_id]
         movie_id = review['movie_id']
         user_id = review.get('user_id')
+        self.movie_versions[movie_id] = (
+            self.movie_versions.get(movie_id, 0) + 1
+        )
 
         # Remove from indexes
-        movie_reviews = self.reviews_by_movie.get(movie_id, [])
-        if review_id in movie_reviews:
-            movie_reviews.remove(review_id)
-            if not movie_reviews:
-                del self.reviews_by_movie[movie_id]
-
+        self._unlink(self.reviews_by_movie, movie_id, review_id)
         if user_id:
-            user_reviews = self.reviews_by_user.get(user_id, [])
-            if review_id in user_reviews:
-                user_reviews.remove(review_id)
-                if not user_reviews:
-                    del self.reviews_by_user[user_id]
+            self._unlink(self.reviews_by_user, user_id, review_id)
 
         del self.reviews[review_id]
 
@@ -204,24 +302,37 @@ class ReviewDAO:
                                          Any],
                        operation: str = 'create') -> None:
         """Append a review operation to the new reviews file"""
+        self._append_reviews([review_dict], operation)
+
+    def _append_reviews(self,
+                        review_dicts: List[Dict[str, Any]],
+                        operation: str = 'create') -> None:
+        """
+        Append one operation per review to the new reviews file, as a
+        single DataFrame write.
+        """
+        if not review_dicts:
+            return
+
         Path(
             self.new_reviews_csv_path).parent.mkdir(
             parents=True,
             exist_ok=True)
 
-        # Prepare row with operation marker
-        row_data = {
-            'operation': operation,
-            'review_id': review_dict['review_id'],
-            'movie_id': review_dict['movie_id'],
-            'user_id': review_dict.get('user_id', ''),
-            'imdb_username': review_dict.get('imdb_username', ''),
-            'rating': review_dict['rating'],
-            'review_text': review_dict['review_text'],
-            'review_date': review_dict['review_date']
-        }
-
-        df = pd.DataFrame([row_data])
+        # Prepare rows with operation marker
+        df = pd.DataFrame([
+            {
+                'operation': operation,
+                'review_id': review_dict['review_id'],
+                'movie_id': review_dict['movie_id'],
+                'user_id': review_dict.get('user_id', ''),
+                'imdb_username': review_dict.get('imdb_username', ''),
+                'rating': review_dict['rating'],
+                'review_text': review_dict['review_text'],
+                'review_date': review_dict['review_date']
+            }
+            for review_dict in review_dicts
+        ])
 
         # Append to CSV
         if Path(self.new_reviews_csv_path).exists():
@@ -293,6 +404,13 @@ class ReviewDAO:
             raise KeyError(f"Review with id {review_id} not found")
         return self.reviews[review_id].copy()
 
+    def get_review_or_none(self, review_id: str) -> Optional[Dict[str, Any]]:
+        """Get a review by ID without copying, or None if it doesn't exist.
+
+        The returned dict is the stored record; callers must not mutate it.
+        """
+        return self.reviews.get(review_id)
+
     def get_reviews_for_movie(self, movie_id: str) -> List[Dict[str, Any]]:
         """Get all reviews for a specific movie"""
         review_ids = self.reviews_by_movie.get(movie_id, [])
@@ -303,6 +421,48 @@ class ReviewDAO:
         review_ids = self.reviews_by_user.get(user_id, [])
         return [self.reviews[rid].copy() for rid in review_ids]
 
+    @staticmethod
+    def feed_key(review: Dict[str, Any]) -> Tuple[str, str]:
+        """Sort key for feeds: (review_date, review_id), newest last."""
+        return (review.get('review_date') or '', review['review_id'])
+
+    def get_reviews_by_user_ids(
+        self,
+        user_ids: List[str],
+        skip: int = 0,
+        limit: int = 10,
+        before: Optional[Tuple[str, str]] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get one page of reviews written by any of the given users,
+        newest first (by review_date, then review_id).
+
+        If before is given (a feed_key from the previous page), only
+        reviews strictly older than it are considered, so deep pages
+        don't have to select and discard skip rows. Only the top
+        skip + limit reviews are selected and only the returned page is
+        copied. Returns (page, total) where total is counted from the
+        user index without touching the reviews.
+        """
+        total = sum(
+            len(self.reviews_by_user.get(user_id, []))
+            for user_id in user_ids
+        )
+        if total == 0 or skip >= total:
+            return [], total
+
+        candidates = (
+            self.reviews[rid]
+            for user_id in user_ids
+            for rid in self.reviews_by_user.get(user_id, [])
+        )
+        if before is not None:
+            candidates = (
+                r for r in candidates if self.feed_key(r) < before
+            )
+        newest = heapq.nlargest(skip + limit, candidates, key=self.feed_key)
+        return [review.copy() for review in newest[skip:]], total
+
     def update_review(self,
                       review_id: str,
                       update_data: Dict[str,
@@ -406,23 +566,48 @@ class ReviewDAO:
         with self._lock:
             movie_id = str(movie_id)
             review_ids = self.reviews_by_movie.get(movie_id, []).copy()
-            deleted_count = 0
+            deleted = []
 
             for review_id in review_ids:
                 review = self.reviews.get(review_id)
                 if review and review.get('user_id') is not None:
                     # Only delete user-created reviews
                     self._remove_review_from_indexes(review_id)
-                    self._append_review(review, operation='delete')
-                    deleted_count += 1
+                    deleted.append(review)
+
+            if deleted:
+                # One append for all deletion markers
+                self._append_reviews(deleted, operation='delete')
+                self._maybe_compact(len(deleted))
+                logger.info(
+                    f"Deleted {len(deleted)} reviews for movie {movie_id}"
+                )
+
+            return len(deleted)
+
+    def delete_reviews_by_user(self, user_id: str) -> int:
+        """
+        Delete all reviews written by a user (cascade delete), with one
+        append for all deletion markers. Returns the number deleted.
+        """
+        with self._lock:
+            review_ids = self.reviews_by_user.get(user_id, []).copy()
+            deleted = []
+
+            for review_id in review_ids:
+                review = self.reviews.get(review_id)
+                if review is not None:
+                    self._remove_review_from_indexes(review_id)
+                    deleted.append(review)
 
-            if deleted_count > 0:
-                self._maybe_compact()
+            if deleted:
+                self._append_reviews(deleted, operation='delete')
+                self._maybe_compact(len(deleted))
                 logger.info(
-                    f"Deleted {deleted_count} reviews for movie {movie_id}"
+                    f"Deleted {len(deleted)} reviews for user {user_id}"
                 )
 
-            return deleted_count
+            return len(deleted)
 
 
 # Global shared instance
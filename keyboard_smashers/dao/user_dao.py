@@ -1,216 +1,466 @@
+import bisect
 import csv
+import json
 import logging
+import os
+import unicodedata
+from collections import deque
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from keyboard_smashers.models.user_model import User
 
 logger = logging.getLogger(__name__)
 
+# Column order of the users CSV. The file is an append-only log: each
+# mutation appends the affected users' latest state (or a delete marker)
+# and the last row per userid wins on load.
+USER_CSV_FIELDS = [
+    'operation',
+    'userid',
+    'username',
+    'email',
+    'password',
+    'reputation',
+    'creation_date',
+    'is_admin',
+    'is_suspended',
+    'total_reviews',
+    'total_penalty_count',
+    'favorites',
+    'following',
+    'followers',
+    'blocked_users',
+    'notifications'
+]
+
+# CSV spelling of booleans, indexed by the bool itself
+_BOOL_STR = ('false', 'true')
+
+# Notifications kept per user; older ones drop off as new ones arrive
+MAX_NOTIFICATIONS = 500
+
+
+def _bounded_notifications(notifications) -> deque:
+    """
+    Wrap a user's notifications (oldest first) in a deque capped at
+    MAX_NOTIFICATIONS, so appending a new one is O(1) and the list
+    can't grow without bound. Already-capped deques are returned as is.
+    """
+    if (isinstance(notifications, deque) and
+            notifications.maxlen == MAX_NOTIFICATIONS):
+        return notifications
+    return deque(notifications, maxlen=MAX_NOTIFICATIONS)
+
+
+def _discard(ids: List[str], item: str) -> bool:
+    """
+    Remove item from an id list in a single scan (rather than a
+    membership test followed by remove). Returns whether it was there.
+    """
+    try:
+        ids.remove(item)
+    except ValueError:
+        return False
+    return True
+
 
 class UserDAO:
 
-    def __init__(self, csv_path: str = "data/users.csv"):
+    def __init__(
+        self,
+        csv_path: str = "data/users.csv"
+    ):
         self.csv_path = csv_path
         self.users: Dict[str, Dict[str, Any]] = {}
         self.email_index: Dict[str, str] = {}
         self.username_index: Dict[str, str] = {}
+        # Bumped whenever username_index changes; keys the sorted
+        # username list used by search_users_by_username
+        self.username_version = 0
+        # (version, sorted username_index keys, their casefolded forms)
+        self._sorted_usernames: Tuple[int, List[str], List[str]] = (
+            -1, [], []
+        )
+        # userid -> normalized email, computed once when the email is
+        # set so index maintenance doesn't renormalize it
+        self._email_keys: Dict[str, str] = {}
         self.user_counter = 1
+        # Bumped whenever users appear, disappear or change suspension,
+        # so callers can detect stale review caches
+        self.visibility_version = 0
+        # Per-user change counters, bumped on every persisted change
+        self.user_versions: Dict[str, int] = {}
+        # userid -> (user dict, user version, upsert CSV row), so
+        # compaction only serializes users changed since their last row
+        self._row_cache: Dict[str, Tuple[dict, int, List[Any]]] = {}
+        # Whether the CSV header supports appends (legacy files without
+        # an 'operation' column are rewritten on first save)
+        self._log_ready = False
+        # Operation counter for auto-compaction
+        self._operation_count = 0
+        self._compact_threshold = 100  # Compact after this many operations
+        # Long-lived handle for writes to the CSV (see _write_rows)
+        self._csv_fh = None
+        self._csv_writer = None
+        # (path, mtime, size) of the CSV as of the last load
+        self._loaded_signature: Optional[Tuple[str, int, int]] = None
         self.load_users()
 
     def load_users(self) -> None:
         csv_file = Path(self.csv_path)
         if not csv_file.exists():
-            logger.warning(f"User CSV file not found at: {self.csv_path}")
+            logger.warning("User CSV file not found at: %s", self.csv_path)
             return
 
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    creation_date = (
-                        datetime.fromisoformat(row['creation_date'])
-                        if row.get('creation_date')
-                        else datetime.now()
-                    )
-
-                    favorites_str = row.get('favorites', '')
-                    favorites = (
-                        [
-                            f.strip()
-                            for f in favorites_str.split(',') if f.strip()
-                        ]
-                        if favorites_str else []
-                    )
-
-                    following_str = row.get('following', '')
-                    following = (
-                        [
-                            f.strip()
-                            for f in following_str.split(',') if f.strip()
-                        ]
-                        if following_str else []
-                    )
+            # Taken before reading so a write racing the load is picked
+            # up by the next refresh_users()
+            signature = self._file_signature()
+            row_count = 0
+            deleted_ids = []
+            parsed_dates: Dict[str, datetime] = {}
+            with open(self.csv_path, 'r', encoding='utf-8',
+                      newline='', buffering=1 << 20) as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                self._log_ready = 'operation' in header
+                # Rows of a current-format file can be written back as is
+                reuse_rows = header == USER_CSV_FIELDS
+
+                # Resolve column positions once; columns missing from
+                # older files point past the header and read as ''
+                width = len(header)
+                col = {name: i for i, name in enumerate(header)}
+                for name in USER_CSV_FIELDS:
+                    if name not in col:
+                        col[name] = width
+                        width += 1
+                (i_operation, i_userid, i_username, i_email, i_password,
+                 i_reputation, i_creation_date, i_is_admin, i_is_suspended,
+                 i_total_reviews, i_total_penalty_count, i_favorites,
+                 i_following, i_followers, i_blocked_users,
+                 i_notifications) = [col[name] for name in USER_CSV_FIELDS]
 
-                    followers_str = row.get('followers', '')
-                    followers = (
-                        [
-                            f.strip()
-                            for f in followers_str.split(',') if f.strip()
-                        ]
-                        if followers_str else []
-                    )
-
-                    blocked_str = row.get('blocked_users', '')
-                    blocked_users = (
-                        [
-                            f.strip()
-                            for f in blocked_str.split(',') if f.strip()
-                        ]
-                        if blocked_str else []
-                    )
+                for row in reader:
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row.extend([''] * (width - len(row)))
+                    row_count += 1
+                    if row[i_operation] == 'delete':
+                        removed = self.users.pop(row[i_userid], None)
+                        if removed is not None:
+                            self._unindex_user(removed)
+                            self._row_cache.pop(row[i_userid], None)
+                            deleted_ids.append(row[i_userid])
+                        continue
+
+                    creation_date_str = row[i_creation_date]
+                    if creation_date_str:
+                        # Each distinct timestamp is parsed once per load
+                        # (seeded and replayed rows repeat them a lot);
+                        # datetimes are immutable so sharing is safe
+                        creation_date = parsed_dates.get(creation_date_str)
+                        if creation_date is None:
+                            creation_date = datetime.fromisoformat(
+                                creation_date_str
+                            )
+                            parsed_dates[creation_date_str] = creation_date
+                    else:
+                        creation_date = datetime.now()
 
-                    # Load notifications (stored as JSON-like string)
+                    # Load notifications (stored as JSON-like string);
+                    # most users have none, so skip the JSON parser
                     notifications = []
-                    notifications_str = row.get('notifications', '')
-                    if notifications_str:
+                    notifications_str = row[i_notifications]
+                    if notifications_str and notifications_str != '[]':
                         try:
-                            import json
                             notifications = json.loads(notifications_str)
                         except (json.JSONDecodeError, ValueError):
                             notifications = []
 
                     user_dict = {
-                        'userid': row['userid'],
-                        'username': row['username'],
-                        'email': row['email'],
-                        'password': row.get('password', ''),
-                        'reputation': int(row.get('reputation', 3)),
+                        'userid': row[i_userid],
+                        'username': row[i_username],
+                        'email': row[i_email],
+                        'password': row[i_password],
+                        'reputation': int(row[i_reputation] or 3),
                         'creation_date': creation_date,
-                        'is_admin': (
-                            row.get('is_admin', 'false').lower() ==
-                            'true'
-                        ),
+                        'is_admin': row[i_is_admin].lower() == 'true',
                         'is_suspended': (
-                            row.get('is_suspended', 'false').lower() ==
-                            'true'
+                            row[i_is_suspended].lower() == 'true'
                         ),
-                        'total_reviews': int(row.get('total_reviews', 0)),
+                        'total_reviews': int(row[i_total_reviews] or 0),
                         'total_penalty_count': int(
-                            row.get('total_penalty_count', 0)
+                            row[i_total_penalty_count] or 0
+                        ),
+                        'favorites': self._split_ids(row[i_favorites]),
+                        'following': self._split_ids(row[i_following]),
+                        'followers': self._split_ids(row[i_followers]),
+                        'blocked_users': self._split_ids(
+                            row[i_blocked_users]
                         ),
-                        'favorites': favorites,
-                        'following': following,
-                        'followers': followers,
-                        'blocked_users': blocked_users,
-                        'notifications': notifications
+                        'notifications': _bounded_notifications(
+                            notifications
+                        )
                     }
 
-                    self.users[user_dict['userid']] = user_dict
-                    self.email_index[user_dict['email'].lower()] = (
-                        user_dict['userid']
-                    )
+                    # Later rows supersede earlier ones for the same user
+                    userid = user_dict['userid']
+                    previous = self.users.get(userid)
+                    if previous is not None:
+                        self._unindex_user(previous)
+
+                    email_lower = self._email_key(user_dict['email'])
+                    self.users[userid] = user_dict
+                    if reuse_rows:
+                        self._row_cache[userid] = (
+                            user_dict, self.user_versions.get(userid, 0), row
+                        )
+                    self._email_keys[userid] = email_lower
+                    self.email_index[email_lower] = userid
                     self.username_index[user_dict['username'].lower()] = (
-                        user_dict['userid']
+                        userid
                     )
 
-                    if user_dict['userid'].startswith("user_"):
-                        try:
-                            user_num = int(user_dict['userid'].split("_")[1])
-                            self.user_counter = (
-                                max(self.user_counter, user_num + 1)
-                            )
-                        except (IndexError, ValueError):
-                            pass
-
-            logger.info(f"Loaded {len(self.users)} users from {self.csv_path}")
+            # Reserve ids past every user_NNN seen, deleted ones included
+            next_id = max(
+                (int(userid[5:]) + 1
+                 for userid in chain(self.users, deleted_ids)
+                 if userid.startswith('user_') and userid[5:].isdecimal()),
+                default=1
+            )
+            self.user_counter = max(self.user_counter, next_id)
+            self.visibility_version += 1
+            self.username_version += 1
+            self._loaded_signature = signature
+            logger.info(
+                "Loaded %s users from %s",
+                len(self.users), self.csv_path
+            )
         except Exception as e:
-            logger.error(f"Error loading users from {self.csv_path}: {e}")
+            logger.error("Error loading users from %s: %s", self.csv_path, e)
             raise
 
+        # Compact on startup if superseded rows have piled up
+        if row_count - len(self.users) > self._compact_threshold:
+            logger.info(
+                "Compacting users on startup (%s operations)",
+                row_count
+            )
+            self.save_users()
+
+    def _file_signature(self) -> Optional[Tuple[str, int, int]]:
+        try:
+            stat = os.stat(self.csv_path)
+        except OSError:
+            return None
+        return (self.csv_path, stat.st_mtime_ns, stat.st_size)
+
+    def refresh_users(self) -> None:
+        """
+        Reload users from the CSV only if it has changed since the last
+        load, so callers that need fresh data don't reparse it every time.
+        """
+        signature = self._file_signature()
+        if signature is None or signature != self._loaded_signature:
+            self.load_users()
+
+    @staticmethod
+    def _split_ids(value: str) -> List[str]:
+        """Parse a comma-separated id list column"""
+        if not value:
+            return []
+        return [item for item in map(str.strip, value.split(',')) if item]
+
+    def _unindex_user(self, user: Dict[str, Any]) -> None:
+        """Drop a user's email/username index entries if they point at it"""
+        email_lower = self._email_keys.pop(user['userid'], None)
+        if email_lower is None:
+            email_lower = self._email_key(user['email'])
+        if self.email_index.get(email_lower) == user['userid']:
+            del self.email_index[email_lower]
+        username_lower = user['username'].lower()
+        if self.username_index.get(username_lower) == user['userid']:
+            del self.username_index[username_lower]
+            self._username_changed(removed=username_lower)
+
+    def _user_to_row(
+        self, user: Dict[str, Any], operation: str = 'upsert'
+    ) -> List[Any]:
+        """Serialize a user dict into a users CSV row, in field order"""
+        if operation == 'delete':
+            return [operation, user['userid']] + [''] * (
+                len(USER_CSV_FIELDS) - 2
+            )
+
+        favorites_str = (
+            ','.join(user.get('favorites', []))
+        )
+        following_str = (
+            ','.join(user.get('following', []))
+        )
+        followers_str = (
+            ','.join(user.get('followers', []))
+        )
+        blocked_str = (
+            ','.join(user.get('blocked_users', []))
+        )
+        # Serialize notifications to JSON
+        notifications = user.get('notifications', [])
+        # Convert datetime objects to strings for JSON serialization
+        notifications_serializable = []
+        for notif in notifications:
+            notif_copy = notif.copy()
+            ts = notif_copy.get('timestamp')
+            if ts and hasattr(ts, 'isoformat'):
+                notif_copy['timestamp'] = ts.isoformat()
+            notifications_serializable.append(notif_copy)
+        notifications_str = json.dumps(notifications_serializable)
+
+        return [
+            operation,
+            user['userid'],
+            user['username'],
+            user['email'],
+            user['password'],
+            user['reputation'],
+            user['creation_date'].isoformat(),
+            _BOOL_STR[bool(user['is_admin'])],
+            _BOOL_STR[bool(user.get('is_suspended', False))],
+            user['total_reviews'],
+            user.get('total_penalty_count', 0),
+            favorites_str,
+            following_str,
+            followers_str,
+            blocked_str,
+            notifications_str
+        ]
+
+    def _cached_row(self, user: Dict[str, Any]) -> List[Any]:
+        """
+        Get a user's upsert row, reusing the last one built unless the
+        user has changed since. Rows are never mutated after being built,
+        so sharing one between writes is safe.
+        """
+        userid = user['userid']
+        version = self.user_versions.get(userid, 0)
+        cached = self._row_cache.get(userid)
+        if (cached is not None and cached[0] is user and
+                cached[1] == version):
+            return cached[2]
+        row = self._user_to_row(user)
+        self._row_cache[userid] = (user, version, row)
+        return row
+
     def save_users(self) -> None:
+        """
+        Rewrite the users CSV with one row per current user. Used for
+        compaction; individual mutations go through _append_users.
+        """
+        rows = [self._cached_row(user) for user in self.users.values()]
+        self._write_rows(rows, 'w')
+        self._log_ready = True
+        self._operation_count = 0
+        logger.info("Saved %s users to %s", len(self.users), self.csv_path)
+
+    def _append_users(
+        self, users: List[Dict[str, Any]], operation: str = 'upsert'
+    ) -> None:
+        """
+        Append the latest state of the given users (or delete markers)
+        to the users CSV instead of rewriting the whole file.
+        """
+        for user in users:
+            userid = user['userid']
+            self.user_versions[userid] = self.user_versions.get(userid, 0) + 1
+
+        if not self._log_ready:
+            # Missing or legacy file: write it out in the log format
+            self.save_users()
+            return
+
+        if operation == 'upsert':
+            rows = [self._cached_row(user) for user in users]
+        else:
+            rows = [self._user_to_row(user, operation) for user in users]
+            for user in users:
+                self._row_cache.pop(user['userid'], None)
+        self._write_rows(rows, 'a')
+
+        self._operation_count += len(users)
+        if self._operation_count >= self._compact_threshold:
+            self.save_users()
+
+    def _write_rows(self, rows: List[List[Any]], mode: str) -> None:
+        """
+        Write rows to the users CSV; mode 'w' rewrites with a header.
+        Appends keep an 'a' handle open between writes so they don't pay
+        for an open/close each time. A rewrite uses its own handle and
+        closes the append one, so later appends reopen at the end of the
+        file instead of at a stale offset.
+        """
         try:
             csv_file = Path(self.csv_path)
-            csv_file.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(csv_file, 'w', encoding='utf-8', newline='') as f:
-                fieldnames = [
-                    'userid',
-                    'username',
-                    'email',
-                    'password',
-                    'reputation',
-                    'creation_date',
-                    'is_admin',
-                    'is_suspended',
-                    'total_reviews',
-                    'total_penalty_count',
-                    'favorites',
-                    'following',
-                    'followers',
-                    'blocked_users',
-                    'notifications'
-                ]
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for user in self.users.values():
-                    favorites_str = (
-                        ','.join(user.get('favorites', []))
-                    )
-                    following_str = (
-                        ','.join(user.get('following', []))
-                    )
-                    followers_str = (
-                        ','.join(user.get('followers', []))
-                    )
-                    blocked_str = (
-                        ','.join(user.get('blocked_users', []))
-                    )
-                    # Serialize notifications to JSON
-                    import json
-                    notifications = user.get('notifications', [])
-                    # Convert datetime objects to strings for JSON
-                    # serialization
-                    notifications_serializable = []
-                    for notif in notifications:
-                        notif_copy = notif.copy()
-                        ts = notif_copy.get('timestamp')
-                        if ts and hasattr(ts, 'isoformat'):
-                            notif_copy['timestamp'] = ts.isoformat()
-                        notifications_serializable.append(notif_copy)
-                    notifications_str = json.dumps(notifications_serializable)
-
-                    writer.writerow({
-                        'userid': user['userid'],
-                        'username': user['username'],
-                        'email': user['email'],
-                        'password': user['password'],
-                        'reputation': user['reputation'],
-                        'creation_date': (
-                            user['creation_date'].isoformat()
-                        ),
-                        'is_admin': str(user['is_admin']).lower(),
-                        'is_suspended': (
-                            str(user.get('is_suspended', False)).lower()
-                        ),
-                        'total_reviews': user['total_reviews'],
-                        'total_penalty_count': (
-                            user.get('total_penalty_count', 0)
-                        ),
-                        'favorites': favorites_str,
-                        'following': following_str,
-                        'followers': followers_str,
-                        'blocked_users': blocked_str,
-                        'notifications': notifications_str
-                    })
-
-            logger.info(f"Saved {len(self.users)} users to {self.csv_path}")
+            if mode == 'w':
+                self.close()
+                csv_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(csv_file, 'w', encoding='utf-8', newline='',
+                          buffering=1 << 20) as f:
+                    writer = csv.writer(f)
+                    writer.writerow(USER_CSV_FIELDS)
+                    writer.writerows(rows)
+                    f.flush()
+                    # A rewrite replaces the whole log, so make sure
+                    # it's on disk; appends are only flushed to the OS
+                    os.fsync(f.fileno())
+                return
+
+            if self._csv_fh is None or (
+                    self._csv_fh.name != os.fspath(self.csv_path)):
+                self.close()
+                csv_file.parent.mkdir(parents=True, exist_ok=True)
+                self._csv_fh = open(
+                    self.csv_path, 'a', encoding='utf-8', newline='',
+                    buffering=1 << 20
+                )
+                self._csv_writer = csv.writer(self._csv_fh)
+            self._csv_writer.writerows(rows)
+            self._csv_fh.flush()
         except Exception as e:
-            logger.error(f"Error saving users to CSV: {e}")
+            logger.error("Error writing users to CSV: %s", e)
+            self.close()
             raise
 
+    def close(self) -> None:
+        """Close the users CSV handle (reopened on the next write)"""
+        if self._csv_fh is not None:
+            try:
+                self._csv_fh.close()
+            except OSError:
+                pass
+            self._csv_fh = None
+            self._csv_writer = None
+
+    def __enter__(self) -> 'UserDAO':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        """
+        Normalize an email for the case-insensitive email index. NFC
+        first, so composed and decomposed spellings of the same address
+        (e.g. from different keyboards) share one key.
+        """
+        return unicodedata.normalize('NFC', email.strip()).lower()
+
     def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
-        email_lower = user_data['email'].lower()
+        email_lower = self._email_key(user_data['email'])
         if email_lower in self.email_index:
             raise ValueError(f"Email '{user_data['email']}'"
                              f" already registered")
@@ -229,7 +479,7 @@ class UserDAO:
             'email': user_data['email'],
             'password': user_data.get('password', ''),
             'reputation': user_data.get('reputation', 3),
-            'creation_date': user_data.get('creation_date', datetime.now()),
+            'creation_date': user_data.get('creation_date') or datetime.now(),
             'is_admin': user_data.get('is_admin', False),
             'is_suspended': user_data.get('is_suspended', False),
             'total_reviews': 0,
@@ -238,31 +488,130 @@ class UserDAO:
             'following': [],
             'followers': [],
             'blocked_users': [],
-            'notifications': []
+            'notifications': _bounded_notifications(())
         }
 
         self.users[user_id] = user_dict
+        self._email_keys[user_id] = email_lower
         self.email_index[email_lower] = user_id
         self.username_index[username_lower] = user_id
-        self.save_users()
+        self._username_changed(added=username_lower)
+        self.visibility_version += 1
+        self._append_users([user_dict])
 
-        logger.info(f"Created user: {user_id} - {user_data['username']}")
+        logger.info("Created user: %s - %s", user_id, user_data['username'])
         return user_dict.copy()
 
     def get_user(self, userid: str) -> Dict[str, Any]:
-        if userid not in self.users:
+        user = self.users.get(userid)
+        if user is None:
             raise KeyError(f"User with ID '{userid}' not found")
-        return self.users[userid].copy()
+        return user.copy()
 
     def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
-        email_lower = email.lower()
-        userid = self.email_index.get(email_lower)
+        userid = self.get_userid_by_email(email)
         if userid:
             return self.users[userid].copy()
         return None
 
-    def get_all_users(self) -> List[Dict[str, Any]]:
-        return [user.copy() for user in self.users.values()]
+    def get_userid_by_email(self, email: str) -> Optional[str]:
+        """Look up a user id by email without copying the user"""
+        return self.email_index.get(self._email_key(email))
+
+    def get_all_users(
+        self, skip: int = 0, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get users in insertion order; only the requested slice is copied"""
+        stop = None if limit is None else skip + limit
+        return [
+            user.copy()
+            for user in islice(self.users.values(), skip, stop)
+        ]
+
+    def get_user_ids(
+        self, skip: int = 0, limit: Optional[int] = None
+    ) -> List[str]:
+        """Get user ids in the same order as get_all_users, without copies"""
+        stop = None if limit is None else skip + limit
+        return list(islice(self.users, skip, stop))
+
+    def _usernames_sorted(self) -> Tuple[List[str], List[str]]:
+        """
+        Get the lowercased usernames in sorted order plus their
+        casefolded forms for matching, rebuilt only after username_index
+        has changed. The length check also catches callers that edit the
+        index directly.
+        """
+        version, names, folded = self._sorted_usernames
+        if (version != self.username_version or
+                len(names) != len(self.username_index)):
+            names = sorted(self.username_index)
+            folded = [name.casefold() for name in names]
+            self._sorted_usernames = (self.username_version, names, folded)
+        return names, folded
+
+    def _username_changed(
+        self, added: Optional[str] = None, removed: Optional[str] = None
+    ) -> None:
+        """
+        Bump username_version after a username_index edit. If the sorted
+        username cache was current, patch it with bisect rather than
+        leaving it to be re-sorted on the next search. The patched lists
+        are new ones, so a search still walking the old lists isn't
+        disturbed.
+        """
+        version, names, folded = self._sorted_usernames
+        current = version == self.username_version
+        self.username_version += 1
+        if not current:
+            return
+        if removed is not None:
+            i = bisect.bisect_left(names, removed)
+            if i == len(names) or names[i] != removed:
+                return
+            names = names[:i] + names[i + 1:]
+            folded = folded[:i] + folded[i + 1:]
+        if added is not None:
+            i = bisect.bisect_left(names, added)
+            names = names[:i] + [added] + names[i:]
+            folded = folded[:i] + [added.casefold()] + folded[i:]
+        self._sorted_usernames = (self.username_version, names, folded)
+
+    def search_userids_by_username(
+        self, query: str = "", skip: int = 0, limit: int = 20
+    ) -> Tuple[List[str], int]:
+        """
+        Find users whose username contains query, compared casefolded
+        (so e.g. 'STRASSE' matches 'Straße'), ordered by username.
+        Returns (page of userids, total).
+        """
+        needle = query.casefold()
+        names, folded = self._usernames_sorted()
+        if not needle:
+            page_names = names[skip:skip + limit]
+            total = len(names)
+        else:
+            # The names are already sorted, so stream the matches: keep
+            # the ones up to the end of the page and only count the rest
+            matches = (
+                name for name, name_folded in zip(names, folded)
+                if needle in name_folded
+            )
+            head = list(islice(matches, skip + limit))
+            page_names = head[skip:]
+            total = len(head) + sum(1 for _ in matches)
+        page = [self.username_index[name] for name in page_names]
+        return page, total
+
+    def search_users_by_username(
+        self, query: str = "", skip: int = 0, limit: int = 20
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Same as search_userids_by_username, but returns copies of the
+        page's user dicts. Returns (page, total).
+        """
+        userids, total = self.search_userids_by_username(query, skip, limit)
+        return [self.users[userid].copy() for userid in userids], total
 
     def update_user(self, userid: str, data: Dict[str, Any]) -> Dict[str, Any]:
         if userid not in self.users:
@@ -271,16 +620,20 @@ class UserDAO:
         user = self.users[userid]
 
         if 'email' in data:
-            new_email_lower = data['email'].lower()
+            new_email_lower = self._email_key(data['email'])
             if (new_email_lower in self.email_index and
                self.email_index[new_email_lower] != userid):
                 raise ValueError(f"Email '{data['email']}' already registered")
 
-            old_email_lower = user['email'].lower()
-            if old_email_lower in self.email_index:
+            old_email_lower = self._email_keys.get(userid)
+            if old_email_lower is None:
+                old_email_lower = self._email_key(user['email'])
+            if (old_email_lower != new_email_lower and
+                    old_email_lower in self.email_index):
                 del self.email_index[old_email_lower]
 
             user['email'] = data['email']
+            self._email_keys[userid] = new_email_lower
             self.email_index[new_email_lower] = userid
 
         if 'username' in data:
@@ -293,9 +646,14 @@ class UserDAO:
             old_username_lower = user['username'].lower()
             if old_username_lower in self.username_index:
                 del self.username_index[old_username_lower]
+            else:
+                old_username_lower = None
 
             user['username'] = data['username']
             self.username_index[new_username_lower] = userid
+            self._username_changed(
+                added=new_username_lower, removed=old_username_lower
+            )
 
         if 'password' in data:
             user['password'] = data['password']
@@ -306,30 +664,26 @@ class UserDAO:
         if 'total_reviews' in data:
             user['total_reviews'] = data['total_reviews']
 
-        self.save_users()
-        logger.info(f"Updated user: {userid}")
+        self._append_users([user])
+        logger.info("Updated user: %s", userid)
         return user.copy()
 
     def delete_user(self, userid: str) -> None:
         if userid not in self.users:
             raise KeyError(f"User with ID '{userid}' not found")
 
-        user = self.users[userid]
-        email_lower = user['email'].lower()
-
-        if email_lower in self.email_index:
-            del self.email_index[email_lower]
-
-        del self.users[userid]
-        self.save_users()
-        logger.info(f"Deleted user: {userid}")
+        user = self.users.pop(userid)
+        self._unindex_user(user)
+        self.visibility_version += 1
+        self._append_users([user], operation='delete')
+        logger.info("Deleted user: %s", userid)
 
     def increment_review_count(self, userid: str) -> None:
         if userid not in self.users:
             raise KeyError(f"User with ID '{userid}' not found")
 
         self.users[userid]['total_reviews'] += 1
-        self.save_users()
+        self._append_users([self.users[userid]])
 
     def increment_penalty_count(self, userid: str) -> None:
         if userid not in self.users:
@@ -339,10 +693,11 @@ class UserDAO:
             self.users[userid]['total_penalty_count'] = 0
 
         self.users[userid]['total_penalty_count'] += 1
-        self.save_users()
-        logger.info(f"Incremented penalty count for user: {userid}"
-                    f"self.users[userid]['total_penalties']"
-                    )
+        self._append_users([self.users[userid]])
+        logger.info(
+            "Incremented penalty count for user: %s (now %s)",
+            userid, self.users[userid]['total_penalty_count']
+        )
 
     def suspend_user(self, userid: str) -> None:
         """Suspend a user account."""
@@ -350,8 +705,9 @@ class UserDAO:
             raise KeyError(f"User with ID '{userid}' not found")
 
         self.users[userid]['is_suspended'] = True
-        self.save_users()
-        logger.info(f"Suspended user: {userid}")
+        self.visibility_version += 1
+        self._append_users([self.users[userid]])
+        logger.info("Suspended user: %s", userid)
 
     def reactivate_user(self, userid: str) -> None:
         """Reactivate a suspended user account."""
@@ -359,8 +715,16 @@ class UserDAO:
             raise KeyError(f"User with ID '{userid}' not found")
 
         self.users[userid]['is_suspended'] = False
-        self.save_users()
-        logger.info(f"Reactivated user: {userid}")
+        self.visibility_version += 1
+        self._append_users([self.users[userid]])
+        logger.info("Reactivated user: %s", userid)
+
+    def is_suspended(self, userid: str) -> bool:
+        """Check whether a user account is suspended."""
+        if userid not in self.users:
+            raise KeyError(f"User with ID '{userid}' not found")
+
+        return self.users[userid].get('is_suspended', False)
 
     def toggle_favorite(self, userid: str, movie_id: str) -> bool:
         """
@@ -375,20 +739,19 @@ class UserDAO:
 
         favorites = self.users[userid]['favorites']
 
-        if movie_id in favorites:
-            favorites.remove(movie_id)
-            self.save_users()
+        if _discard(favorites, movie_id):
+            self._append_users([self.users[userid]])
             logger.info(
-                f"Removed movie {movie_id} from"
-                f" user {userid}'s favorites"
+                "Removed movie %s from user %s's favorites",
+                movie_id, userid
             )
             return False
         else:
             favorites.append(movie_id)
-            self.save_users()
+            self._append_users([self.users[userid]])
             logger.info(
-                f"Added movie {movie_id} to"
-                f" user {userid}'s favorites"
+                "Added movie %s to user %s's favorites",
+                movie_id, userid
             )
             return True
 
@@ -423,7 +786,6 @@ class UserDAO:
             followee['followers'].append(follower_id)
 
             # Send notification using Observer pattern
-            from keyboard_smashers.models.user_model import User
             followee_user = User(
                 username=followee['username'],
                 email=followee['email'],
@@ -439,7 +801,9 @@ class UserDAO:
                 blocked_users=followee.get('blocked_users', [])
             )
             # Load existing notifications before adding new one
-            followee_user.notifications = followee.get('notifications', [])
+            followee_user.notifications = _bounded_notifications(
+                followee.get('notifications', ())
+            )
 
             # Create a dummy review object for notification
             class FollowNotification:
@@ -453,10 +817,8 @@ class UserDAO:
             # Update notifications in dict
             followee['notifications'] = followee_user.notifications
 
-            self.save_users()
-            logger.info(
-                f"User {follower_id} now follows {followee_id}"
-            )
+            self._append_users([follower, followee])
+            logger.info("User %s now follows %s", follower_id, followee_id)
 
     def unfollow_user(self, follower_id: str, followee_id: str) -> None:
         """Remove follow relationship between two users."""
@@ -473,50 +835,73 @@ class UserDAO:
         if 'followers' not in followee:
             followee['followers'] = []
 
-        if followee_id in follower['following']:
-            follower['following'].remove(followee_id)
-        if follower_id in followee['followers']:
-            followee['followers'].remove(follower_id)
+        removed = _discard(follower['following'], followee_id)
+        removed = _discard(followee['followers'], follower_id) or removed
 
-        self.save_users()
-        logger.info(
-            f"User {follower_id} unfollowed {followee_id}"
-        )
+        # Nothing to persist if they weren't following
+        if removed:
+            self._append_users([follower, followee])
+        logger.info("User %s unfollowed %s", follower_id, followee_id)
 
     def get_followers(self, userid: str) -> List[Dict[str, Any]]:
         """Get list of users who follow this user."""
-        if userid not in self.users:
-            raise KeyError(f"User with ID '{userid}' not found")
-
-        user = self.users[userid]
-        follower_ids = user.get('followers', [])
-
-        followers = []
-        for follower_id in follower_ids:
-            if follower_id in self.users:
-                followers.append(self.users[follower_id].copy())
-
-        return followers
+        return [
+            self.users[follower_id].copy()
+            for follower_id in self.get_follower_ids(userid)
+        ]
 
     def get_following(self, userid: str) -> List[Dict[str, Any]]:
         """Get list of users that this user follows."""
+        return [
+            self.users[following_id].copy()
+            for following_id in self.get_following_ids(userid)
+        ]
+
+    def _existing_ids(self, userid: str, field: str):
+        """
+        Lazily yield the ids in one of a user's id lists that still refer
+        to existing users (deleted users are left in other users' lists)
+        """
         if userid not in self.users:
             raise KeyError(f"User with ID '{userid}' not found")
 
-        user = self.users[userid]
-        following_ids = user.get('following', [])
+        users = self.users
+        return (
+            other_id for other_id in users[userid].get(field, [])
+            if other_id in users
+        )
+
+    def get_follower_ids(
+        self, userid: str, skip: int = 0, limit: Optional[int] = None
+    ) -> List[str]:
+        """Get a page of this user's follower ids, without copies"""
+        stop = None if limit is None else skip + limit
+        return list(
+            islice(self._existing_ids(userid, 'followers'), skip, stop)
+        )
+
+    def get_following_ids(
+        self, userid: str, skip: int = 0, limit: Optional[int] = None
+    ) -> List[str]:
+        """Get a page of the ids this user follows, without copies"""
+        stop = None if limit is None else skip + limit
+        return list(
+            islice(self._existing_ids(userid, 'following'), skip, stop)
+        )
 
-        following = []
-        for following_id in following_ids:
-            if following_id in self.users:
-                following.append(self.users[following_id].copy())
+    def get_followers_count(self, userid: str) -> int:
+        """Count this user's followers without building a list"""
+        return sum(1 for _ in self._existing_ids(userid, 'followers'))
 
-        return following
+    def get_following_count(self, userid: str) -> int:
+        """Count the users this user follows without building a list"""
+        return sum(1 for _ in self._existing_ids(userid, 'following'))
 
-    def block_user(self, blocker_id: str, blocked_id: str):
+    def block_user(self, blocker_id: str, blocked_id: str) -> str:
         """
         Block a user. Bidirectional blocking - both users block each other.
         Automatically removes any existing follow relationships.
+        Returns the blocked user's username.
         """
         if blocker_id not in self.users:
             raise KeyError(f"User with ID '{blocker_id}' not found")
@@ -542,24 +927,26 @@ class UserDAO:
             blocked['blocked_users'].append(blocker_id)
 
         # Remove any existing follow relationships
-        if 'following' in blocker and blocked_id in blocker['following']:
-            blocker['following'].remove(blocked_id)
-        if 'followers' in blocker and blocked_id in blocker['followers']:
-            blocker['followers'].remove(blocked_id)
-        if 'following' in blocked and blocker_id in blocked['following']:
-            blocked['following'].remove(blocker_id)
-        if 'followers' in blocked and blocker_id in blocked['followers']:
-            blocked['followers'].remove(blocker_id)
-
-        self.save_users()
+        if 'following' in blocker:
+            _discard(blocker['following'], blocked_id)
+        if 'followers' in blocker:
+            _discard(blocker['followers'], blocked_id)
+        if 'following' in blocked:
+            _discard(blocked['following'], blocker_id)
+        if 'followers' in blocked:
+            _discard(blocked['followers'], blocker_id)
+
+        self._append_users([blocker, blocked])
         logger.info(
-            f"User {blocker_id} blocked {blocked_id}"
-            f" (bidirectional block applied)"
+            "User %s blocked %s (bidirectional block applied)",
+            blocker_id, blocked_id
         )
+        return blocked['username']
 
-    def unblock_user(self, unblocker_id: str, blocked_id: str):
+    def unblock_user(self, unblocker_id: str, blocked_id: str) -> str:
         """
         Unblock a user. Removes bidirectional block for both users.
+        Returns the unblocked user's username.
         """
         if unblocker_id not in self.users:
             raise KeyError(f"User with ID '{unblocker_id}' not found")
@@ -576,16 +963,15 @@ class UserDAO:
             blocked['blocked_users'] = []
 
         # Remove bidirectional block (idempotent)
-        if blocked_id in unblocker['blocked_users']:
-            unblocker['blocked_users'].remove(blocked_id)
-        if unblocker_id in blocked['blocked_users']:
-            blocked['blocked_users'].remove(unblocker_id)
+        _discard(unblocker['blocked_users'], blocked_id)
+        _discard(blocked['blocked_users'], unblocker_id)
 
-        self.save_users()
+        self._append_users([unblocker, blocked])
         logger.info(
-            f"User {unblocker_id} unblocked {blocked_id}"
-            f" (bidirectional unblock applied)"
+            "User %s unblocked %s (bidirectional unblock applied)",
+            unblocker_id, blocked_id
         )
+        return blocked['username']
 
     def is_blocked(self, user_id: str, other_user_id: str) -> bool:
         """
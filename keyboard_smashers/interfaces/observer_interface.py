@@ -2,6 +2,9 @@ from abc import ABC, abstractmethod
 
 
 class Observer(ABC):
+    # No instance dict, so subclasses can use __slots__
+    __slots__ = ()
+
     @abstractmethod
     def update(self, review, event_type, event_data):
         """Called when review is updated"""
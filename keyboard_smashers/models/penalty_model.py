@@ -6,6 +6,12 @@ logger = logging.getLogger(__name__)
 
 
 class Penalty:
+    # PenaltyDAO keeps the whole penalty history loaded, expired ones
+    # included, and the fields below are all a penalty ever has
+    __slots__ = (
+        'penalty_id', 'user_id', 'reason', 'severity', 'start_date',
+        'end_date', 'issued_by', 'created_at'
+    )
 
     def __init__(
         self,
@@ -35,11 +41,6 @@ class Penalty:
         self.issued_by = issued_by
         self.created_at = created_at if created_at else datetime.now()
 
-        logger.info(
-            f"Penalty created: {penalty_id} for user {user_id} "
-            f"(Severity: {severity})"
-        )
-
     def _validate_severity(self, severity: int) -> int:
         if not isinstance(severity, int) or severity < 1 or severity > 5:
             logger.warning(
@@ -71,6 +72,20 @@ class Penalty:
             'created_at': self.created_at.isoformat()
         }
 
+    def to_row(self) -> tuple:
+        """Return the persisted fields as a tuple, in CSV column order"""
+        end_date = self.end_date
+        return (
+            self.penalty_id,
+            self.user_id,
+            self.reason,
+            self.severity,
+            self.start_date.isoformat(),
+            end_date.isoformat() if end_date else None,
+            self.issued_by,
+            self.created_at.isoformat()
+        )
+
     @classmethod
     def from_dict(cls, data: dict) -> 'Penalty':
         return cls(
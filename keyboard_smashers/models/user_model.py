@@ -2,13 +2,51 @@ from datetime import datetime
 import re
 import logging
 import hashlib
+import hmac
 import os
 from keyboard_smashers.interfaces.observer_interface import Observer
 
 logger = logging.getLogger(__name__)
 
+# Password rules, compiled once rather than looked up in re's cache on
+# every set_password call
+_SPECIAL_CHAR_RE = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+_UPPERCASE_RE = re.compile(r'[A-Z]')
+_LOWERCASE_RE = re.compile(r'[a-z]')
+
+
+def verify_password(stored_password, password):
+    """
+    Check a password against a stored "salt$hash" (or legacy plain text)
+    value, comparing in constant time.
+    """
+    if '$' in stored_password:
+        try:
+            salt, stored_hash = stored_password.split('$')
+        except ValueError:
+            return False
+        input_hash = hashlib.sha256((password + salt).encode()).hexdigest()
+        return hmac.compare_digest(input_hash, stored_hash)
+    # Legacy plain text password support
+    return hmac.compare_digest(stored_password.encode(), password.encode())
+
+
+# Verified against when a login email matches no user, so an unknown
+# email costs the same hash as a wrong password and doesn't reveal
+# which accounts exist
+DUMMY_PASSWORD_HASH = f"{os.urandom(16).hex()}${os.urandom(32).hex()}"
+
 
 class User(Observer):
+    # Slots instead of a per-instance __dict__: smaller users and
+    # cheaper attribute access
+    __slots__ = (
+        'username', 'email', 'userid', 'password', 'reputation',
+        'creation_date', 'reviews', 'total_reviews', 'is_admin',
+        'is_suspended', 'notifications', 'total_penalty_count',
+        'penalties', 'following', 'followers', 'blocked_users'
+    )
+
     def __init__(self, username, email, userid, password=None, reputation=3,
                  creation_date=None, is_admin=False, total_penalty_count=0,
                  is_suspended=False, following=None, followers=None,
@@ -31,42 +69,48 @@ class User(Observer):
         self.blocked_users = blocked_users if blocked_users is not None else []
 
         logger.info(
-            f"User created:"
-            f"{self.username} (ID: {userid}, Admin: {self.is_admin})")
+            "User created: %s (ID: %s, Admin: %s)",
+            self.username, userid, self.is_admin
+        )
 
         if password:
             self.password = password
 
     def set_password(self, password):
 
-        logger.debug(f"Setting password for user: {self.username}")
+        logger.debug("Setting password for user: %s", self.username)
         try:
             if len(password) < 8:
                 logger.warning(
-                    f"Password validation failed for"
-                    f"{self.username}: Too short")
+                    "Password validation failed for %s: Too short",
+                    self.username
+                )
                 raise ValueError("Password must be at least 8 characters long")
             if not any(char.isdigit() for char in password):
                 logger.warning(
-                    f"Password validation failed for"
-                    f"{self.username}: No digit")
+                    "Password validation failed for %s: No digit",
+                    self.username
+                )
                 raise ValueError("Password must contain at least one digit.")
-            if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+            if not _SPECIAL_CHAR_RE.search(password):
                 logger.warning(
-                    f"Password validation failed for"
-                    f"{self.username}: No special character")
+                    "Password validation failed for %s: No special character",
+                    self.username
+                )
                 raise ValueError(
                     "Password must contain at least one special character.")
-            if not re.search(r'[A-Z]', password):
+            if not _UPPERCASE_RE.search(password):
                 logger.warning(
-                    f"Password validation failed for"
-                    f"{self.username}: No uppercase letter")
+                    "Password validation failed for %s: No uppercase letter",
+                    self.username
+                )
                 raise ValueError(
                     "Password must contain at least one uppercase letter.")
-            if not re.search(r'[a-z]', password):
+            if not _LOWERCASE_RE.search(password):
                 logger.warning(
-                    f"Password validation failed for"
-                    f"{self.username}: No lowercase letter")
+                    "Password validation failed for %s: No lowercase letter",
+                    self.username
+                )
                 raise ValueError(
                     "Password must contain at least one lowercase letter.")
 
@@ -77,47 +121,44 @@ class User(Observer):
             # Store both: "salt$hash"
             self.password = f"{salt}${hashed}"
 
-            logger.info(f"Password set successfully for user: {self.username}")
+            logger.info(
+                "Password set successfully for user: %s",
+                self.username
+            )
             return "Password set successfully"
 
         except ValueError as e:
             logger.error(
-                f"Error setting password for user"
-                f"{self.username}: {e}")
+                "Error setting password for user %s: %s",
+                self.username, e
+            )
             raise
 
     def check_password(self, password):
         if not self.password:
             return False
 
-        if '$' in self.password:
-            try:
-                salt, stored_hash = self.password.split('$')
-                input_hash = hashlib.sha256(
-                    (password + salt).encode()).hexdigest()
-                is_correct = input_hash == stored_hash
-            except ValueError:
-                is_correct = False
-        else:
-            # Legacy plain text password support
-            is_correct = self.password == password
+        is_correct = verify_password(self.password, password)
 
         if is_correct:
-            logger.debug(f"Password check passed for user: {self.username}")
+            logger.debug("Password check passed for user: %s", self.username)
         else:
-            logger.debug(f"Password check failed for user: {self.username}")
+            logger.debug("Password check failed for user: %s", self.username)
 
         return is_correct
 
     def add_review(self, review):
         logger.debug(
-            f"User"
-            f"{self.username} adding review ID: {review.review_id}")
+            "User %s adding review ID: %s",
+            self.username, review.review_id
+        )
         self.reviews.append(review)
         self.total_reviews += 1
 
-        logger.info(f"Review ID: {review.review_id} added by user: "
-                    f"{self.username}. Total reviews: {self.total_reviews}")
+        logger.info(
+            "Review ID: %s added by user: %s. Total reviews: %s",
+            review.review_id, self.username, self.total_reviews
+        )
 
     def update(self, review, event_type, event_data):
         notification = {
@@ -128,11 +169,14 @@ class User(Observer):
         }
         self.notifications.append(notification)
 
-        logger.info(f"User {self.username} notified of event: {event_type} ")
+        logger.info(
+            "User %s notified of event: %s ",
+            self.username, event_type
+        )
         print(
             f"[NOTIFICATION] {self.username}: {event_type}"
             f" - {event_data.get('message', '')}")
 
     def get_notifications(self):
-        logger.debug(f"Fetching notifications for user: {self.username}")
+        logger.debug("Fetching notifications for user: %s", self.username)
         return self.notifications